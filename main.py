@@ -4,6 +4,8 @@ import asyncio
 import logging
 from typing import List, Sequence
 
+import aiohttp
+
 from arbbot.core.config_loader import ConfigLoader, Config
 from arbbot.core.market_graph import MarketGraph, MarketEdge
 from arbbot.core.orderbook_cache import OrderbookCache
@@ -13,8 +15,10 @@ from arbbot.core.scanner import ArbitrageScanner, ExecutionCoordinator
 from arbbot.core.balance import QuoteBalances
 from arbbot.core.volatility_cache import VolatilityCache
 from arbbot.infra.account_service import AccountService
+from arbbot.infra.http_session import create_shared_session
 from arbbot.infra.rest_client_ccxt import RestBootstrapper
 from arbbot.infra.ws_manager_ccxt import WSManager
+from arbbot.utils.event_loop import install_event_loop_policy
 from arbbot.utils.logging import setup_logging
 from arbbot.exchange.models import MarketInfo
 
@@ -23,26 +27,22 @@ logger = logging.getLogger(__name__)
 
 
 def _filter_markets(markets: Sequence[MarketInfo], config: Config) -> List[MarketInfo]:
-    allowed_quotes = set(config.min_order.quote_min_notional.keys())
-    enabled_tokens = {symbol for symbol, token in config.tokens.items() if token.enabled}
-    filtered: List[MarketInfo] = []
-    for market in markets:
-        if "-" not in market.market:
-            continue
-        quote, base = market.market.split("-")
-        if quote not in allowed_quotes:
-            continue
-        if base not in enabled_tokens:
-            continue
-        filtered.append(market)
-    return filtered
+    allowed_quotes = frozenset(config.min_order.quote_min_notional.keys())
+    enabled_tokens = frozenset(symbol for symbol, token in config.tokens.items() if token.enabled)
+    return [
+        market
+        for market in markets
+        if (parts := market.market.partition("-"))[1]
+        and parts[0] in allowed_quotes
+        and parts[2] in enabled_tokens
+    ]
 
 
 def _find_edge(graph: MarketGraph, from_asset: str, to_asset: str) -> MarketEdge:
-    for edge in graph.edges:
-        if edge.from_asset == from_asset and edge.to_asset == to_asset:
-            return edge
-    raise ValueError(f"Missing edge {from_asset}->{to_asset}")
+    try:
+        return graph.edge(from_asset, to_asset)
+    except KeyError:
+        raise ValueError(f"Missing edge {from_asset}->{to_asset}") from None
 
 
 async def _run_self_test(
@@ -97,7 +97,8 @@ async def _run_roundtrip_test(
     except ValueError as exc:
         logger.warning("Self-test %s skipped: %s", label, exc)
         return
-    start_amount = min(balances_available, max_trade, min_quote * 4)
+    cap = min(max_trade, min_quote * 4)
+    start_amount = balances_available if balances_available < cap else cap
     if start_amount <= 0:
         logger.warning("Self-test %s skipped: insufficient starting capital", label)
         return
@@ -131,9 +132,9 @@ async def _run_roundtrip_test(
     )
     if label == "KRW→USDC→KRW":
         snapshot = snapshots.get(forward.market_code)
-        if snapshot and snapshot.bids and snapshot.asks:
-            best_bid = snapshot.bids[0].price
-            best_ask = snapshot.asks[0].price
+        if snapshot:
+            best_bid, _ = snapshot.top_level("bids")
+            best_ask, _ = snapshot.top_level("asks")
             mid = (best_bid + best_ask) / 2
             half_spread = ((best_ask - best_bid) / mid) / 2 if mid > 0 else 0.0
             fee = forward.bid_fee
@@ -159,23 +160,29 @@ async def _run_roundtrip_test(
 async def async_main() -> None:
     config = ConfigLoader().load()
     setup_logging(debug_mode=config.logging.debug_mode)
+    async with create_shared_session() as http_session:
+        await _run_bot(config, http_session)
+
+
+async def _run_bot(config: Config, http_session: aiohttp.ClientSession) -> None:
     orderbook_cache = OrderbookCache()
     vol_cache = VolatilityCache(config)
 
-    async with RestBootstrapper() as rest:
+    async with RestBootstrapper(session=http_session) as rest:
         markets = await rest.fetch_markets()
         filtered_markets = _filter_markets(markets, config)
         if not filtered_markets:
             raise RuntimeError("No markets available for configured tokens")
         graph = MarketGraph.build(filtered_markets, config)
         path_model = PathModel(graph, config)
-        orderbook_markets = sorted(path_model.markets_in_use())
+        orderbook_markets = sorted(path_model.markets_in_use)
         ticker_markets = sorted({market for market in orderbook_markets if market.startswith("KRW-")})
-        seed_books = await rest.fetch_orderbooks(orderbook_markets)
-        if seed_books:
-            for book in seed_books:
-                await orderbook_cache.update(book)
-            logger.info("Seeded %d orderbooks via REST before WS warm-up", len(seed_books))
+        seeded = 0
+        async for market, book in rest.iter_orderbooks(orderbook_markets, depth=config.scanner.orderbook_depth):
+            await orderbook_cache.update(rest.exchange_name, market, book)
+            seeded += 1
+        if seeded:
+            logger.info("Seeded %d orderbooks via REST before WS warm-up", seeded)
         else:
             logger.warning("No orderbooks returned from REST seeding step")
 
@@ -205,6 +212,8 @@ async def async_main() -> None:
         orderbook_markets=orderbook_markets,
         ticker_markets=ticker_markets,
         debug=config.logging.debug_mode,
+        orderbook_depth=config.scanner.orderbook_depth,
+        session=http_session,
     )
     execution = ExecutionCoordinator()
     scanner = ArbitrageScanner(
@@ -224,6 +233,7 @@ async def async_main() -> None:
 
 
 def main() -> None:
+    install_event_loop_policy(io_uring=ConfigLoader().load().scanner.io_uring_event_loop)
     try:
         asyncio.run(async_main())
     except KeyboardInterrupt:  # pragma: no cover - interactive convenience
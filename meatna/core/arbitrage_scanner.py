@@ -2,15 +2,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Dict, Iterable, Mapping, Sequence
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
 
 from meatna.core.config_loader import Config
-from meatna.core.balance import QuoteBalances
+from meatna.core.balance import QuoteBalances, QuoteBalancesTable
+from meatna.core.cycle_detector import NegativeCycleDetector
 from meatna.core.orderbook_cache import OrderbookCache, OrderbookSnapshot
 from meatna.core.volatility_cache import VolatilityCache
 from meatna.core.path_model import PathModel
 from meatna.core.path_evaluator import PathEvaluator, PathEvaluation, EvaluationDebug
-from meatna.utils.logging import debug_log
 
 logger = logging.getLogger(__name__)
 
@@ -22,17 +24,27 @@ class ArbitrageScannerMulti:
         config: Config,
         path_model: PathModel,
         caches: Dict[str, OrderbookCache],
-        balances: Dict[str, QuoteBalances],
+        balances: Mapping[str, QuoteBalances] | QuoteBalancesTable,
         volatility_cache: VolatilityCache | None = None,
     ):
         self._config = config
         self._path_model = path_model
         self._caches = caches
+        if not isinstance(balances, QuoteBalancesTable):
+            balances = QuoteBalancesTable(balances)
         self._balances = balances
         self._vol = volatility_cache
         self._evaluator = PathEvaluator(config)
         self._best_delta = float("-inf")
         self._best_record = None
+        self._markets_by_exchange: Dict[str, Dict[str, int]] = {}
+        market_index = path_model.market_index
+        for path in path_model.paths:
+            for leg in path.edges:
+                market = leg.market_code.rpartition("::")[2]
+                self._markets_by_exchange.setdefault(leg.exchange, {})[market] = market_index[leg.market_code]
+        self._cycles = NegativeCycleDetector([leg for path in path_model.paths for leg in path.edges], market_index)
+        self._gate_on_cycles = config.risk_model.min_profit_margin >= 0
 
     async def run_once(self) -> dict | None:
 
@@ -41,48 +53,28 @@ class ArbitrageScannerMulti:
                 logger.info("Waiting for initial orderbook for %s...", ex)
                 return None
 
-        start_usdc = sum([b.usdc for b in self._balances.values()])
+        start_usdc = self._balances.total("usdc")
         if start_usdc <= 0:
             return None
 
         start = asyncio.get_running_loop().time()
-        evaluated = 0
-        ops = 0
         sigma_map = await self._snapshot_sigmas()
-
-        for path in self._path_model.paths:
-
-            snapshots: Dict[str, OrderbookSnapshot] = {}
-
-            missing = False
-            for leg in path.edges:
-                cache = self._caches.get(leg.exchange)
-                if not cache:
-                    missing = True
-                    break
-                snap = await cache.snapshot(leg.market_code)
-                if not snap:
-                    missing = True
-                    break
-                snapshots[leg.market_code] = snap
-
-            if missing:
-                continue
-
-            evaluated += 1
-            result, dbg = self._evaluator.evaluate(
-                path_id=path.path_id,
-                edges=path.edges,
-                assets=path.assets,
-                starting_notional=start_usdc,
-                snapshots=snapshots,
-                sigma_by_asset=sigma_map,
-                debug=False,
-            )
-
-            if result:
-                ops += 1
-                self._update_best(path, result)
+        snapshots = await self._collect_snapshots()
+        # Paths whose books are all present; padding legs index the trailing True.
+        present = np.array([snap is not None for snap in snapshots] + [True])
+        evaluated = int(present[self._path_model.edge_market_idx].all(axis=1).sum())
+        ops = 0
+        # Depth, fees and risk penalties only lower a path's return below its
+        # top-of-book rate product, so without a negative cycle nothing can pass.
+        if not self._gate_on_cycles or self._cycles.find_cycle(snapshots) is not None:
+            arrays = self._evaluator.evaluate_arrays(self._path_model, start_usdc, snapshots, sigma_map)
+            passed, delta_final = arrays[0], arrays[5]
+            ops = int(passed.sum())
+            if ops:
+                rows = np.flatnonzero(passed)
+                row = int(rows[np.argmax(delta_final[rows])])
+                best = self._evaluator.build_evaluation(self._path_model, row, start_usdc, arrays)
+                self._update_best(self._path_model.paths[row], best)
 
         dur = (asyncio.get_running_loop().time() - start) * 1000
         return {
@@ -92,10 +84,21 @@ class ArbitrageScannerMulti:
             **self._best_summary(),
         }
 
+    async def _collect_snapshots(self) -> List[Optional[OrderbookSnapshot]]:
+        snapshots: List[Optional[OrderbookSnapshot]] = [None] * len(self._path_model.market_codes)
+        for ex, slots in self._markets_by_exchange.items():
+            cache = self._caches.get(ex)
+            if not cache:
+                continue
+            found = await cache.snapshot_many(ex, slots.keys())
+            for market, snap in found.items():
+                snapshots[slots[market]] = snap
+        return snapshots
+
     async def _snapshot_sigmas(self) -> Mapping[str, float]:
         if not self._vol:
             return {}
-        return await self._vol.snapshot_sigmas(self._path_model.assets_in_paths())
+        return await self._vol.snapshot_sigmas(self._path_model.assets_in_paths)
 
     def _update_best(self, path, eval: PathEvaluation):
         if eval.delta_final <= self._best_delta:
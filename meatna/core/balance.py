@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Dict, Mapping
+
+import numpy as np
 
 
 @dataclass(frozen=True)
@@ -9,3 +12,50 @@ class QuoteBalances:
     btc: float
     usdt: float
     usdc: float = 0.0
+
+
+_COLUMNS = ("usd", "btc", "usdt", "usdc")
+_COLUMN_INDEX = {name: i for i, name in enumerate(_COLUMNS)}
+
+
+class QuoteBalancesTable:
+
+    def __init__(self, balances: Mapping[str, QuoteBalances] | None = None) -> None:
+        balances = balances or {}
+        self._idx: Dict[str, int] = {exchange: i for i, exchange in enumerate(balances)}
+        self._arr = np.array(
+            [[getattr(b, col) for col in _COLUMNS] for b in balances.values()],
+            dtype=np.float64,
+        ).reshape(-1, len(_COLUMNS))
+        self._totals: Dict[str, float] = {}
+
+    def _row(self, exchange: str) -> int:
+        row = self._idx.get(exchange)
+        if row is None:
+            row = len(self._idx)
+            self._idx[exchange] = row
+            self._arr = np.vstack([self._arr, np.zeros((1, len(_COLUMNS)))])
+        return row
+
+    def set(self, exchange: str, kind: str, value: float) -> None:
+        row = self._row(exchange)
+        self._arr[row, _COLUMN_INDEX[kind]] = value
+        self._totals.clear()
+
+    def update(self, exchange: str, balances: QuoteBalances) -> None:
+        row = self._row(exchange)
+        self._arr[row] = [getattr(balances, col) for col in _COLUMNS]
+        self._totals.clear()
+
+    def get(self, exchange: str) -> QuoteBalances | None:
+        row = self._idx.get(exchange)
+        if row is None:
+            return None
+        return QuoteBalances(**{col: float(self._arr[row, i]) for i, col in enumerate(_COLUMNS)})
+
+    def total(self, kind: str = "usdc") -> float:
+        cached = self._totals.get(kind)
+        if cached is None:
+            cached = float(self._arr[:, _COLUMN_INDEX[kind]].sum())
+            self._totals[kind] = cached
+        return cached
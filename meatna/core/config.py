@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Mapping, Optional, List
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 DEFAULT_SIGMA_BY_TIER = {
     0: 0.0003,
@@ -26,7 +33,7 @@ def load_secrets(path: str | Path = None) -> Dict[str, Any]:
         raise FileNotFoundError(f"secrets.yaml not found at: {path}")
 
     with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=_Loader) or {}
 
 
 
@@ -119,6 +126,8 @@ class LoggingConfig:
 @dataclass(frozen=True)
 class ScannerConfig:
     scan_interval_ms: int
+    orderbook_depth: int
+    io_uring_event_loop: bool
 
 
 @dataclass(frozen=True)
@@ -145,8 +154,12 @@ class ConfigLoader:
         if not self._path.exists():
             raise FileNotFoundError(f"Config file not found: {self._path}")
 
+        resolved = self._path.resolve()
+        return copy.deepcopy(_load_cached(str(resolved), resolved.stat().st_mtime_ns))
+
+    def _parse(self) -> Config:
         with self._path.open("r", encoding="utf-8") as f:
-            raw = yaml.safe_load(f) or {}
+            raw = yaml.load(f, Loader=_Loader) or {}
 
         bot_mode = BotModeConfig(
             dry_run=bool(raw.get("bot_mode", {}).get("dry_run", True))
@@ -247,6 +260,8 @@ class ConfigLoader:
         sc = raw.get("scanner", {})
         scanner = ScannerConfig(
             scan_interval_ms=int(sc.get("scan_interval_ms", 100)),
+            orderbook_depth=int(sc.get("orderbook_depth", 10)),
+            io_uring_event_loop=bool(sc.get("io_uring_event_loop", False)),
         )
 
         return Config(
@@ -265,5 +280,10 @@ class ConfigLoader:
         )
 
 
+@lru_cache(maxsize=4)
+def _load_cached(path: str, mtime_ns: int) -> Config:
+    return ConfigLoader(path)._parse()
+
+
 def load_config(path: str | Path = "config.yaml") -> Config:
     return ConfigLoader(path).load()
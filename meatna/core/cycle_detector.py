@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from meatna.utils.jit import njit
+
+from .market_graph import MarketEdge
+from .orderbook_cache import OrderbookSnapshot
+
+
+@njit(cache=True)
+def _bellman_ford(src: np.ndarray, dst: np.ndarray, weights: np.ndarray, n_nodes: int) -> Tuple[int, np.ndarray]:
+    # Virtual source: every node starts at distance 0, so any negative cycle is reachable.
+    dist = np.zeros(n_nodes)
+    pred = np.full(n_nodes, -1, np.int32)
+    last_updated = -1
+    for _ in range(n_nodes):
+        last_updated = -1
+        for e in range(src.shape[0]):
+            candidate = dist[src[e]] + weights[e]
+            if candidate < dist[dst[e]]:
+                dist[dst[e]] = candidate
+                pred[dst[e]] = e
+                last_updated = dst[e]
+        if last_updated == -1:
+            break
+    return last_updated, pred
+
+
+class NegativeCycleDetector:
+
+    def __init__(self, edges: Sequence[MarketEdge], market_index: Mapping[str, int]) -> None:
+        self._edges: List[MarketEdge] = list(dict.fromkeys(edges))
+        self._market_slots = [market_index[e.market_code] for e in self._edges]
+        assets = sorted({e.from_asset for e in self._edges} | {e.to_asset for e in self._edges})
+        self._asset_idx: Dict[str, int] = {asset: i for i, asset in enumerate(assets)}
+        self._src = np.array([self._asset_idx[e.from_asset] for e in self._edges], dtype=np.int32)
+        self._dst = np.array([self._asset_idx[e.to_asset] for e in self._edges], dtype=np.int32)
+        self._weights = np.empty(len(self._edges), dtype=np.float64)
+
+    def weights(self, snapshots: Sequence[Optional[OrderbookSnapshot]]) -> np.ndarray:
+        # -log of the top-of-book conversion rate; legs without a book are unusable.
+        weights = self._weights
+        for i, edge in enumerate(self._edges):
+            snapshot = snapshots[self._market_slots[i]]
+            if snapshot is None:
+                weights[i] = math.inf
+            elif edge.is_buy:
+                weights[i] = snapshot.log_best_ask
+            else:
+                weights[i] = -snapshot.log_best_bid
+        return weights
+
+    def find_cycle(self, snapshots: Sequence[Optional[OrderbookSnapshot]]) -> Optional[List[MarketEdge]]:
+        if not self._edges:
+            return None
+        n_nodes = len(self._asset_idx)
+        last_updated, pred = _bellman_ford(self._src, self._dst, self.weights(snapshots), n_nodes)
+        if last_updated == -1:
+            return None
+        node = int(last_updated)
+        for _ in range(n_nodes):
+            node = int(self._src[pred[node]])
+        cycle: List[MarketEdge] = []
+        current = node
+        while True:
+            edge_idx = int(pred[current])
+            cycle.append(self._edges[edge_idx])
+            current = int(self._src[edge_idx])
+            if current == node:
+                break
+        cycle.reverse()
+        return cycle
+
+
+__all__ = ["NegativeCycleDetector"]
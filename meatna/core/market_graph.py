@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Iterable, Union
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Dict, List, Iterable, Tuple, Union
 
 from meatna.exchange.models import MarketInfo
 
+_DEFAULT_MIN_ORDER = SimpleNamespace(quote_min_notional={}, min_notional_multiplier=1.0)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MarketEdge:
     market_code: str
     from_asset: str
@@ -16,6 +19,14 @@ class MarketEdge:
     min_total: float
     is_reversed: bool
     exchange: str = ""
+    one_minus_fee: float = field(init=False, repr=False, compare=False)
+    one_plus_fee: float = field(init=False, repr=False, compare=False)
+    is_buy: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "is_buy", self.side == "buy")
+        object.__setattr__(self, "one_minus_fee", 1.0 - self.fee_rate)
+        object.__setattr__(self, "one_plus_fee", 1.0 + self.fee_rate)
 
     @property
     def direction(self) -> str:
@@ -39,7 +50,8 @@ class MarketGraph:
 
         self._edges: List[MarketEdge] = []
         self._by_source: Dict[str, List[MarketEdge]] = {}
-        self._min_order = getattr(config, "min_order", None)
+        self._by_pair: Dict[Tuple[str, str], MarketEdge] = {}
+        self._min_order = getattr(config, "min_order", None) or _DEFAULT_MIN_ORDER
 
         for market_key, m in markets.items():
             quote = m.quote_currency
@@ -80,9 +92,6 @@ class MarketGraph:
             self._add_edge(sell_edge)
 
     def _compute_min_total(self, quote: str) -> float:
-        if not self._min_order:
-            return 1.0
-
         base_min = self._min_order.quote_min_notional.get(quote, 1.0)
         multiplier = self._min_order.min_notional_multiplier
         return float(base_min) * float(multiplier)
@@ -90,10 +99,14 @@ class MarketGraph:
     def _add_edge(self, edge: MarketEdge) -> None:
         self._edges.append(edge)
         self._by_source.setdefault(edge.from_asset, []).append(edge)
+        self._by_pair.setdefault((edge.from_asset, edge.to_asset), edge)
 
     def out_edges(self, asset: str) -> Iterable[MarketEdge]:
         return self._by_source.get(asset, [])
 
+    def edge(self, from_asset: str, to_asset: str) -> MarketEdge:
+        return self._by_pair[(from_asset, to_asset)]
+
     @property
     def edges(self) -> List[MarketEdge]:
         return self._edges
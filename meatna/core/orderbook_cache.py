@@ -2,142 +2,224 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
 
-from meatna.utils.logging import debug_log
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+_EMPTY_SIDE = np.empty(0, dtype=np.float64)
+# Maps monotonic receive stamps onto wall-clock time when one is needed.
+_WALL_CLOCK_OFFSET_NS = time.time_ns() - time.monotonic_ns()
 
-@dataclass(frozen=True)
-class OrderbookLevel:
-    price: float
-    size: float
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class OrderbookSnapshot:
     exchange: str
     market: str
-    bids: Sequence[OrderbookLevel]
-    asks: Sequence[OrderbookLevel]
+    bid_px: np.ndarray
+    bid_sz: np.ndarray
+    ask_px: np.ndarray
+    ask_sz: np.ndarray
     timestamp_ms: int
+    received_ns: int = 0
+    valid: bool = field(init=False, repr=False)
+    best_bid: float = field(init=False, repr=False)
+    best_ask: float = field(init=False, repr=False)
+    log_best_bid: float = field(init=False, repr=False)
+    log_best_ask: float = field(init=False, repr=False)
+    bid_cum_size: np.ndarray = field(init=False, repr=False)
+    bid_cum_value: np.ndarray = field(init=False, repr=False)
+    ask_cum_size: np.ndarray = field(init=False, repr=False)
+    ask_cum_cost: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        best_bid = float(self.bid_px[0]) if self.bid_px.size else 0.0
+        best_ask = float(self.ask_px[0]) if self.ask_px.size else 0.0
+        object.__setattr__(self, "valid", best_bid > 0 and best_ask > 0)
+        object.__setattr__(self, "best_bid", best_bid)
+        object.__setattr__(self, "best_ask", best_ask)
+        object.__setattr__(self, "log_best_bid", math.log(best_bid) if best_bid > 0 else -math.inf)
+        object.__setattr__(self, "log_best_ask", math.log(best_ask) if best_ask > 0 else -math.inf)
+        object.__setattr__(self, "bid_cum_size", np.cumsum(self.bid_sz))
+        object.__setattr__(self, "bid_cum_value", np.cumsum(self.bid_px * self.bid_sz))
+        object.__setattr__(self, "ask_cum_size", np.cumsum(self.ask_sz))
+        object.__setattr__(self, "ask_cum_cost", np.cumsum(self.ask_px * self.ask_sz))
+
+    @property
+    def received_wall_ms(self) -> int:
+        return (self.received_ns + _WALL_CLOCK_OFFSET_NS) // 1_000_000
+
+    def top_level(self, side: str) -> Tuple[float, float]:
+        if side == "bids":
+            return float(self.bid_px[0]), float(self.bid_sz[0])
+        return float(self.ask_px[0]), float(self.ask_sz[0])
+
+
+def _is_ordered(prices: np.ndarray, descending: bool) -> bool:
+    steps = np.diff(prices)
+    return bool((steps <= 0).all() if descending else (steps >= 0).all())
+
+
+def _side_arrays(
+    raw_levels: Sequence | np.ndarray,
+    descending: bool,
+    presorted: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Already-decoded (N, 2) float64 arrays pass through np.asarray without a copy;
+    # nested lists from ccxt are converted in a single C-level pass.
+    levels = np.asarray(raw_levels, dtype=np.float64)
+    if levels.ndim != 2 or not levels.shape[0]:
+        return _EMPTY_SIDE, _EMPTY_SIDE
+    levels = levels[(levels[:, 0] > 0) & (levels[:, 1] > 0)]
+    if not presorted and not _is_ordered(levels[:, 0], descending):
+        order = np.argsort(levels[:, 0], kind="stable")
+        if descending:
+            order = order[::-1]
+        levels = levels[order]
+    px, sz = np.ascontiguousarray(levels[:, :2].T)
+    return px, sz
+
+
+def build_snapshot(
+    exchange: str,
+    market: str,
+    raw_bids: Sequence | np.ndarray,
+    raw_asks: Sequence | np.ndarray,
+    timestamp_ms: int,
+    presorted: bool = False,
+    received_ns: int = 0,
+) -> Optional[OrderbookSnapshot]:
+    bid_px, bid_sz = _side_arrays(raw_bids, descending=True, presorted=presorted)
+    ask_px, ask_sz = _side_arrays(raw_asks, descending=False, presorted=presorted)
+    if not bid_px.size or not ask_px.size:
+        return None
+    return OrderbookSnapshot(
+        exchange=exchange,
+        market=market,
+        bid_px=bid_px,
+        bid_sz=bid_sz,
+        ask_px=ask_px,
+        ask_sz=ask_sz,
+        timestamp_ms=timestamp_ms,
+        received_ns=received_ns,
+    )
 
 
 class OrderbookCache:
 
+    # ccxt normalises these books best-price-first, so the order check is skipped.
+    TRUST_SORTED: FrozenSet[str] = frozenset({"coinbase", "kraken"})
+
     def __init__(self, single_exchange: str = None) -> None:
+        # Snapshots are immutable and only written from the event loop, so
+        # readers can use the dict directly without an asyncio.Lock.
         self._books: Dict[str, OrderbookSnapshot] = {}
-        self._lock = asyncio.Lock()
+        self._by_market: Dict[str, OrderbookSnapshot] = {}
         self._single_exchange = single_exchange
+        self._pending: Dict[Tuple[str, str], tuple] = {}
+        self._pending_ready = asyncio.Event()
+        self.dropped_updates = 0
 
-    async def update_snapshot(self, exchange: str, market: str, orderbook: dict) -> None:
-        if not orderbook: 
-            return
-        
-        raw_bids = orderbook.get("bids", [])
-        raw_asks = orderbook.get("asks", [])
-        timestamp = orderbook.get("timestamp", 0)
-
-        bids=[
-            OrderbookLevel(float(p), float(q))
-            for p, q in raw_bids
-            if p > 0 and q > 0
-        ]
-        asks=[
-            OrderbookLevel(float(p), float(q))
-            for p, q in raw_asks
-            if p > 0 and q > 0
-        ]
-        if not bids or not asks:
-            key = f"{exchange}.{market}"
-            debug_log(logger, f"Skipping {key} — no positive bids/asks")
-            return
-        
-        bids.sort(key=lambda x: x.price, reverse=True)
-        asks.sort(key=lambda x: x.price)
-
-        snapshot = OrderbookSnapshot(
-            exchange=exchange,
-            market=market,
-            bids=tuple(bids),
-            asks=tuple(asks),
-            timestamp_ms=int(timestamp or 0),
-        )
-        await self.update_snapshot(snapshot)
- 
+    def submit(
+        self,
+        exchange: str,
+        market: str,
+        bids: np.ndarray,
+        asks: np.ndarray,
+        timestamp_ms: int = 0,
+        received_ns: int = 0,
+    ) -> None:
+        # Non-blocking hand-off for receive loops; run_writer() applies it.
+        # Only the latest book per market is kept while the writer is behind.
+        key = (exchange, market)
+        if key in self._pending:
+            self.dropped_updates += 1
+        self._pending[key] = (exchange, market, bids, asks, timestamp_ms, received_ns)
+        self._pending_ready.set()
+
+    async def run_writer(self) -> None:
+        while True:
+            await self._pending_ready.wait()
+            self._pending_ready.clear()
+            pending, self._pending = self._pending, {}
+            for update in pending.values():
+                try:
+                    await self.update_arrays(*update)
+                except Exception:
+                    logger.exception("Failed to apply orderbook update for %s.%s", update[0], update[1])
 
     async def update(self, exchange: str, market: str, orderbook: dict) -> None:
         if not orderbook:
             return
 
-        raw_bids = orderbook.get("bids", [])
-        raw_asks = orderbook.get("asks", [])
-        timestamp = orderbook.get("timestamp", 0)
-
-        bids = [
-            OrderbookLevel(float(p), float(q))
-            for p, q in raw_bids
-            if p > 0 and q > 0
-        ]
-        asks = [
-            OrderbookLevel(float(p), float(q))
-            for p, q in raw_asks
-            if p > 0 and q > 0
-        ]
-
-        if not bids or not asks:
-            key = f"{exchange}.{market}"
-            debug_log(logger, f"Skipping {key} — no positive bids/asks")
-            return
-
-        bids.sort(key=lambda x: x.price, reverse=True)
-        asks.sort(key=lambda x: x.price)
+        await self.update_arrays(
+            exchange,
+            market,
+            orderbook.get("bids", []),
+            orderbook.get("asks", []),
+            int(orderbook.get("timestamp") or 0),
+        )
 
-        snapshot = OrderbookSnapshot(
-            exchange=exchange,
-            market=market,
-            bids=tuple(bids),
-            asks=tuple(asks),
-            timestamp_ms=int(timestamp or 0),
+    async def update_arrays(
+        self,
+        exchange: str,
+        market: str,
+        bids: np.ndarray,
+        asks: np.ndarray,
+        timestamp_ms: int = 0,
+        received_ns: int = 0,
+    ) -> None:
+        snapshot = build_snapshot(
+            exchange,
+            market,
+            bids,
+            asks,
+            timestamp_ms,
+            presorted=exchange in self.TRUST_SORTED,
+            received_ns=received_ns or time.monotonic_ns(),
         )
 
-        await self.update_snapshot(snapshot)
+        if snapshot is None:
+            logger.debug("Skipping %s.%s — no positive bids/asks", exchange, market)
+            return
+
+        await self._store(snapshot)
+
+    async def _store(self, snapshot: OrderbookSnapshot) -> None:
+        self._books[f"{snapshot.exchange}.{snapshot.market}"] = snapshot
+        current = self._by_market.get(snapshot.market)
+        if current is None or current.exchange == snapshot.exchange:
+            self._by_market[snapshot.market] = snapshot
 
     async def get_snapshot(self, exchange: str, market: str) -> Optional[OrderbookSnapshot]:
-        key = f"{exchange}.{market}"
-        async with self._lock:
-            return self._books.get(key)
+        return self._books.get(f"{exchange}.{market}")
 
     async def snapshot(self, market: str) -> Optional[OrderbookSnapshot]:
-        async with self._lock:
-            if self._single_exchange:
-                if "::" in market:
-                    market = market.split("::", 1)[1]
-                return self._books.get(market)
-            else:
-                for _, snap in self._books.items():
-                    if snap.market == market:
-                        return snap
-                return None
+        if self._single_exchange:
+            if "::" in market:
+                market = market.split("::", 1)[1]
+            return self._books.get(f"{self._single_exchange}.{market}")
+        return self._by_market.get(market)
 
     async def snapshot_many(
         self,
         exchange: str,
         markets: Iterable[str],
     ) -> Mapping[str, OrderbookSnapshot]:
-        async with self._lock:
-            return {
-                m: self._books[f"{exchange}.{m}"]
-                for m in markets
-                if f"{exchange}.{m}" in self._books
-            }
+        books = self._books
+        found: Dict[str, OrderbookSnapshot] = {}
+        for m in markets:
+            snap = books.get(f"{exchange}.{m}")
+            if snap is not None:
+                found[m] = snap
+        return found
 
     async def markets(self) -> List[str]:
-        async with self._lock:
-            return list(self._books.keys())
+        return list(self._books.keys())
 
     async def has_data(self) -> bool:
-        async with self._lock:
-            return bool(self._books)
+        return bool(self._books)
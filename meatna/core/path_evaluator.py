@@ -4,15 +4,55 @@ import logging
 from dataclasses import dataclass
 from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
+
 from .config import Config, TokenRule
 from .market_graph import MarketEdge
 from .orderbook_cache import OrderbookSnapshot
-from meatna.utils.logging import debug_log
+from .path_model import PathModel
+from meatna.utils.jit import njit
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Rounding room for the top-of-book bound so pruning never drops a path the
+# full walk would have accepted.
+_BOUND_SLACK = 1e-12
+
+
+@njit(cache=True)
+def _walk_asks(
+    ask_px: np.ndarray, ask_cum_cost: np.ndarray, ask_cum_size: np.ndarray, quote_amount: float
+) -> Tuple[float, float, int, float]:
+    filled = int(np.searchsorted(ask_cum_cost, quote_amount, side="right"))
+    spent = float(ask_cum_cost[filled - 1]) if filled else 0.0
+    acquired = float(ask_cum_size[filled - 1]) if filled else 0.0
+    if filled == ask_px.shape[0]:
+        return spent, acquired, filled, 0.0
+    partial = float((quote_amount - spent) / ask_px[filled])
+    return quote_amount, acquired + partial, filled, partial
+
+
+@njit(cache=True)
+def _walk_bids(
+    bid_px: np.ndarray, bid_cum_size: np.ndarray, bid_cum_value: np.ndarray, base_amount: float
+) -> Tuple[float, float, int, float]:
+    filled = int(np.searchsorted(bid_cum_size, base_amount, side="right"))
+    sold = float(bid_cum_size[filled - 1]) if filled else 0.0
+    proceeds = float(bid_cum_value[filled - 1]) if filled else 0.0
+    if filled == bid_px.shape[0]:
+        return proceeds, sold, filled, 0.0
+    partial = base_amount - sold
+    return float(proceeds + bid_px[filled] * partial), base_amount, filled, partial
+
+
+def _depth_levels(px: np.ndarray, sz: np.ndarray, filled: int, partial: float) -> Tuple[tuple[float, float], ...]:
+    levels = list(zip(px[:filled].tolist(), sz[:filled].tolist()))
+    if filled < len(px):
+        levels.append((float(px[filled]), partial))
+    return tuple(levels)
+
+
+@dataclass(frozen=True, slots=True)
 class LegResult:
     market_code: str
     side: str
@@ -24,7 +64,7 @@ class LegResult:
     depth_used: Sequence[tuple[float, float]]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PathEvaluation:
     path_id: str
     starting_amount: float
@@ -36,7 +76,7 @@ class PathEvaluation:
     legs: Sequence[LegResult]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EvaluationDebug:
     path_id: str
     assets: Sequence[str]
@@ -51,12 +91,110 @@ class EvaluationDebug:
     orderbooks: Mapping[str, Dict[str, Sequence[tuple[float, float]]]]
 
 
+@dataclass(frozen=True, slots=True)
+class _BookMatrix:
+    valid: np.ndarray
+    best_bid: np.ndarray
+    best_ask: np.ndarray
+    bid_depth: np.ndarray
+    bid_px: np.ndarray
+    bid_cum_size: np.ndarray
+    bid_cum_value: np.ndarray
+    ask_depth: np.ndarray
+    ask_px: np.ndarray
+    ask_cum_size: np.ndarray
+    ask_cum_cost: np.ndarray
+
+
+def _stack_books(books: Sequence[Optional[OrderbookSnapshot]]) -> _BookMatrix:
+    # One row per market. Cumulative columns come from the snapshots and are
+    # held flat past the real depth, so padding never adds size or cost.
+    n_markets = len(books)
+    width = max([1] + [max(b.bid_px.size, b.ask_px.size) for b in books if b is not None])
+    bid_px = np.ones((n_markets, width))
+    ask_px = np.ones((n_markets, width))
+    bid_cum_size = np.zeros((n_markets, width))
+    bid_cum_value = np.zeros((n_markets, width))
+    ask_cum_size = np.zeros((n_markets, width))
+    ask_cum_cost = np.zeros((n_markets, width))
+    bid_depth = np.zeros(n_markets, dtype=np.int64)
+    ask_depth = np.zeros(n_markets, dtype=np.int64)
+    valid = np.zeros(n_markets, dtype=bool)
+    best_bid = np.zeros(n_markets)
+    best_ask = np.zeros(n_markets)
+    for i, book in enumerate(books):
+        if book is None:
+            continue
+        nb, na = book.bid_px.size, book.ask_px.size
+        if nb:
+            bid_px[i, :nb] = book.bid_px
+            bid_cum_size[i, :nb] = book.bid_cum_size
+            bid_cum_size[i, nb:] = book.bid_cum_size[-1]
+            bid_cum_value[i, :nb] = book.bid_cum_value
+            bid_cum_value[i, nb:] = book.bid_cum_value[-1]
+        if na:
+            ask_px[i, :na] = book.ask_px
+            ask_cum_size[i, :na] = book.ask_cum_size
+            ask_cum_size[i, na:] = book.ask_cum_size[-1]
+            ask_cum_cost[i, :na] = book.ask_cum_cost
+            ask_cum_cost[i, na:] = book.ask_cum_cost[-1]
+        bid_depth[i] = nb
+        ask_depth[i] = na
+        valid[i] = book.valid
+        best_bid[i] = book.best_bid
+        best_ask[i] = book.best_ask
+    return _BookMatrix(
+        valid=valid,
+        best_bid=best_bid,
+        best_ask=best_ask,
+        bid_depth=bid_depth,
+        bid_px=bid_px,
+        bid_cum_size=bid_cum_size,
+        bid_cum_value=bid_cum_value,
+        ask_depth=ask_depth,
+        ask_px=ask_px,
+        ask_cum_size=ask_cum_size,
+        ask_cum_cost=ask_cum_cost,
+    )
+
+
+def _walk_asks_batch(books: _BookMatrix, market_idx: np.ndarray, quote_amount: np.ndarray):
+    rows = np.arange(market_idx.size)
+    cum_cost = books.ask_cum_cost[market_idx]
+    depth = books.ask_depth[market_idx]
+    filled = np.minimum((cum_cost <= quote_amount[:, None]).sum(axis=1), depth)
+    last = np.maximum(filled - 1, 0)
+    spent = np.where(filled > 0, cum_cost[rows, last], 0.0)
+    acquired = np.where(filled > 0, books.ask_cum_size[market_idx, last], 0.0)
+    has_partial = filled < depth
+    next_px = books.ask_px[market_idx, np.minimum(filled, books.ask_px.shape[1] - 1)]
+    partial = np.where(has_partial, (quote_amount - spent) / next_px, 0.0)
+    return np.where(has_partial, quote_amount, spent), acquired + partial
+
+
+def _walk_bids_batch(books: _BookMatrix, market_idx: np.ndarray, base_amount: np.ndarray):
+    rows = np.arange(market_idx.size)
+    cum_size = books.bid_cum_size[market_idx]
+    depth = books.bid_depth[market_idx]
+    filled = np.minimum((cum_size <= base_amount[:, None]).sum(axis=1), depth)
+    last = np.maximum(filled - 1, 0)
+    sold = np.where(filled > 0, cum_size[rows, last], 0.0)
+    proceeds = np.where(filled > 0, books.bid_cum_value[market_idx, last], 0.0)
+    has_partial = filled < depth
+    next_px = books.bid_px[market_idx, np.minimum(filled, books.bid_px.shape[1] - 1)]
+    partial = np.where(has_partial, base_amount - sold, 0.0)
+    proceeds = np.where(has_partial, proceeds + next_px * partial, proceeds)
+    return proceeds, np.where(has_partial, base_amount, sold)
+
+
 class PathEvaluator:
 
     def __init__(self, config: Config):
         self._config = config
         self._first_leg_multiplier = config.min_order.first_leg_multiplier
         self._safety_multiplier = config.min_order.min_notional_multiplier
+        self._capture_depth = min(5, config.scanner.orderbook_depth)
+        self._simulators = (self._simulate_sell, self._simulate_buy)
 
     def evaluate(
         self,
@@ -69,12 +207,14 @@ class PathEvaluator:
         *,
         debug: bool = False,
     ) -> Tuple[Optional[PathEvaluation], Optional[EvaluationDebug]]:
+
         current_amount = starting_notional
         legs: List[LegResult] = []
         reason = ""
-        orderbook_views = self._capture_books(edges, snapshots, depth=5) if debug else {}
+        orderbook_views = self._capture_books(edges, snapshots, depth=self._capture_depth) if debug else {}
         total_slippage = 0.0
         sigmas = sigma_by_asset or {}
+        simulators = self._simulators
 
         if edges:
             required_first_leg = edges[0].min_total * self._first_leg_multiplier
@@ -86,7 +226,7 @@ class PathEvaluator:
 
         for idx, edge in enumerate(edges):
             if current_amount <= 0:
-                debug_log(logger, "Zero notional before %s amount=%.12f", edge.market_code, current_amount)
+                logger.debug("Zero notional before %s amount=%.12f", edge.market_code, current_amount)
                 reason = "Leg received zero notional"
                 return self._fail(path_id, assets, starting_notional, current_amount, legs, reason, orderbook_views, debug)
             assert current_amount > 0, f"Zero notional entering leg {edge.market_code}"
@@ -94,20 +234,18 @@ class PathEvaluator:
             if not snapshot:
                 reason = f"missing snapshot for {edge.market_code}"
                 return self._fail(path_id, assets, starting_notional, current_amount, legs, reason, orderbook_views, debug)
-            if not self._validate_snapshot(edge.market_code, snapshot):
+            if not snapshot.valid:
                 reason = f"invalid snapshot for {edge.market_code}"
                 return self._fail(path_id, assets, starting_notional, current_amount, legs, reason, orderbook_views, debug)
-            if not self._has_input_for_leg(current_amount, edge, snapshot):
+            safety_min = edge.min_total * self._safety_multiplier
+            if current_amount * (1.0 if edge.is_buy else snapshot.best_bid) < safety_min:
                 reason = f"input below minimum for {edge.market_code}"
                 return self._fail(path_id, assets, starting_notional, current_amount, legs, reason, orderbook_views, debug)
 
-            multiplier = self._first_leg_multiplier if idx == 0 else self._safety_multiplier
-            min_quote_required = edge.min_total * multiplier
+            min_quote_required = required_first_leg if idx == 0 else safety_min
 
-            if edge.direction == "buy":
-                result, leg_reason, leg_slip = self._simulate_buy(edge, snapshot, current_amount, min_quote_required)
-            else:
-                result, leg_reason, leg_slip = self._simulate_sell(edge, snapshot, current_amount, min_quote_required)
+            simulate = simulators[edge.is_buy]
+            result, leg_reason, leg_slip = simulate(edge, snapshot, current_amount, min_quote_required, debug)
 
             if result is None:
                 reason = leg_reason or f"unable to execute {edge.market_code}"
@@ -120,19 +258,6 @@ class PathEvaluator:
                 return self._fail(path_id, assets, starting_notional, current_amount, legs, reason, orderbook_views, debug)
             total_slippage += leg_slip
 
-            if idx + 1 < len(edges):
-                next_edge = edges[idx + 1]
-                next_snapshot = snapshots.get(next_edge.market_code)
-                if not next_snapshot:
-                    reason = f"missing snapshot for {next_edge.market_code}"
-                    return self._fail(path_id, assets, starting_notional, current_amount, legs, reason, orderbook_views, debug)
-                if not self._validate_snapshot(next_edge.market_code, next_snapshot):
-                    reason = f"invalid snapshot for {next_edge.market_code}"
-                    return self._fail(path_id, assets, starting_notional, current_amount, legs, reason, orderbook_views, debug)
-                if not self._has_input_for_leg(current_amount, next_edge, next_snapshot):
-                    reason = f"insufficient size for next leg {next_edge.market_code}"
-                    return self._fail(path_id, assets, starting_notional, current_amount, legs, reason, orderbook_views, debug)
-
         delta_inst = current_amount / starting_notional - 1.0
         delta_vol = self._compute_vol_penalty(assets, sigmas)
         extra_edge = self._extra_edge_requirement(assets)
@@ -166,38 +291,156 @@ class PathEvaluator:
             return (None, debug_info) if debug else (None, None)
         return evaluation, (debug_info if debug else None)
 
+    def evaluate_arrays(
+        self,
+        path_model: PathModel,
+        starting_notional: float,
+        snapshots: Sequence[Optional[OrderbookSnapshot]],
+        sigma_by_asset: Mapping[str, float] | None = None,
+    ) -> Tuple[np.ndarray, ...]:
+        # Vectorized non-debug evaluate() over every path of the model: each
+        # leg position is walked for all still-alive paths at once. snapshots
+        # is indexed like path_model.market_codes (None when missing). Returns
+        # per-path (passed, final_amount, delta_inst, delta_vol, delta_slip,
+        # delta_final) and per-leg (notional, effective_price, output) arrays,
+        # all aligned with path_model.paths.
+        n_paths, max_len = path_model.edge_market_idx.shape
+        if not n_paths or starting_notional <= 0:
+            zeros = np.zeros(n_paths)
+            legs = np.zeros((n_paths, max_len))
+            return np.zeros(n_paths, dtype=bool), zeros, zeros, zeros, zeros, zeros, legs, legs, legs
+        books = _stack_books(snapshots)
+        market_idx = path_model.edge_market_idx
+        is_buy = path_model.edge_is_buy
+        min_quote_req = path_model.edge_min_quote
+        safety_req = path_model.edge_safety_min
+        price_mul = path_model.edge_price_mul
+        lengths = path_model.path_lengths
+
+        delta_vol, min_profit = self._risk_thresholds(path_model, sigma_by_asset or {})
+        alive = starting_notional >= min_quote_req[:, 0]
+        alive &= self._upper_bounds(path_model, books) - delta_vol + _BOUND_SLACK > min_profit
+        amount = np.full(n_paths, float(starting_notional))
+        total_slippage = np.zeros(n_paths)
+        notional = np.zeros((n_paths, max_len))
+        effective = np.zeros((n_paths, max_len))
+        outputs = np.zeros((n_paths, max_len))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for leg in range(max_len):
+                active = np.flatnonzero(alive & (lengths > leg))
+                if not active.size:
+                    break
+                m = market_idx[active, leg]
+                amt = amount[active]
+                buy = is_buy[active, leg]
+                safety_min = safety_req[active, leg]
+                min_quote = min_quote_req[active, leg]
+                ok = books.valid[m] & (
+                    (safety_min <= 0) | np.where(buy, amt >= safety_min, amt * books.best_bid[m] >= safety_min)
+                )
+
+                spent, acquired = _walk_asks_batch(books, m, amt)
+                proceeds, sold = _walk_bids_batch(books, m, amt)
+                ok &= np.where(
+                    buy,
+                    (amt - spent <= 1e-9) & (acquired > 0) & (spent >= min_quote),
+                    (amt - sold <= 1e-9) & (proceeds >= min_quote),
+                )
+                vwap = np.where(buy, spent / acquired, proceeds / amt)
+                eff = vwap * price_mul[active, leg]
+                slip = np.where(
+                    buy,
+                    np.maximum(0.0, (eff - books.best_ask[m]) / books.best_ask[m]),
+                    np.maximum(0.0, (books.best_bid[m] - eff) / books.best_bid[m]),
+                )
+                out = np.where(buy, acquired, proceeds)
+                ok &= (vwap > 0) & (out > 0)
+
+                notional[active, leg] = np.where(buy, spent, proceeds)
+                effective[active, leg] = eff
+                outputs[active, leg] = out
+                amount[active] = np.where(ok, out, amount[active])
+                total_slippage[active] += np.where(ok, slip, 0.0)
+                alive[active] = ok
+
+        delta_inst = amount / starting_notional - 1.0
+        delta_final = delta_inst - delta_vol - total_slippage
+        passed = alive & (delta_final > min_profit)
+        return passed, amount, delta_inst, delta_vol, total_slippage, delta_final, notional, effective, outputs
+
+    def build_evaluation(
+        self,
+        path_model: PathModel,
+        row: int,
+        starting_notional: float,
+        arrays: Tuple[np.ndarray, ...],
+    ) -> PathEvaluation:
+        _, amount, delta_inst, delta_vol, delta_slip, delta_final, notional, effective, outputs = arrays
+        path = path_model.paths[row]
+        legs: List[LegResult] = []
+        leg_input = float(starting_notional)
+        for leg, edge in enumerate(path.edges):
+            buy = edge.is_buy
+            leg_output = float(outputs[row, leg])
+            legs.append(
+                LegResult(
+                    market_code=edge.market_code,
+                    side="buy" if buy else "sell",
+                    notional_quote=float(notional[row, leg]),
+                    effective_price=float(effective[row, leg]),
+                    input_amount=leg_input,
+                    output_amount=leg_output,
+                    fee_rate=edge.bid_fee if buy else edge.ask_fee,
+                    depth_used=(),
+                )
+            )
+            leg_input = leg_output
+        return PathEvaluation(
+            path_id=path.path_id,
+            starting_amount=starting_notional,
+            final_amount=float(amount[row]),
+            delta_inst=float(delta_inst[row]),
+            delta_vol=float(delta_vol[row]),
+            delta_slip=float(delta_slip[row]),
+            delta_final=float(delta_final[row]),
+            legs=legs,
+        )
+
+    def _risk_thresholds(
+        self, path_model: PathModel, sigma_by_asset: Mapping[str, float]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        # Per-path vol penalty and profit threshold: one gather + max over each
+        # path's assets, with a trailing 0.0 for padding and USD.
+        assets = path_model.asset_codes
+        sigma_arr = np.array([sigma_by_asset.get(a, 0.0) if a != "USD" else 0.0 for a in assets] + [0.0])
+        extra_arr = np.array(
+            [token.extra_edge_required if (token := self._config.tokens.get(a)) else 0.0 for a in assets] + [0.0]
+        )
+        idx = path_model.path_asset_idx
+        delta_vol = self._config.risk_model.vol_risk_multiplier * sigma_arr[idx].max(axis=1)
+        min_profit = self._config.risk_model.min_profit_margin + extra_arr[idx].max(axis=1)
+        return delta_vol, min_profit
+
+    def _upper_bounds(self, path_model: PathModel, books: _BookMatrix) -> np.ndarray:
+        market_idx = path_model.edge_market_idx
+        in_path = np.arange(market_idx.shape[1]) < path_model.path_lengths[:, None]
+        with np.errstate(divide="ignore"):
+            rates = np.where(path_model.edge_is_buy, 1.0 / books.best_ask[market_idx], books.best_bid[market_idx])
+        rates = np.where(books.valid[market_idx], rates, 0.0)
+        return np.where(in_path, rates, 1.0).prod(axis=1) - 1.0 - path_model.path_fee_total
+
     def _simulate_buy(
         self,
         edge: MarketEdge,
         snapshot: OrderbookSnapshot,
         quote_amount: float,
         min_quote_required: float,
+        debug: bool = False,
     ) -> Tuple[Optional[LegResult], Optional[str], float]:
         assert quote_amount > 0, f"Zero notional entering leg {edge.market_code}"
-        remaining = quote_amount
-        acquired = 0.0
-        spent = 0.0
-        depth_used: List[tuple[float, float]] = []
-        for level in snapshot.asks:
-            price = level.price
-            size = level.size
-            assert price > 0, f"Zero-price detected in {edge.market_code}"
-            if size <= 0:
-                continue
-            cost = price * size
-            if cost <= remaining:
-                acquired += size
-                spent += cost
-                depth_used.append((price, size))
-                remaining -= cost
-            else:
-                size_partial = remaining / price
-                acquired += size_partial
-                spent += remaining
-                depth_used.append((price, size_partial))
-                remaining = 0.0
-                break
-        if remaining > 1e-9 or acquired <= 0:
+        spent, acquired, filled, partial = _walk_asks(snapshot.ask_px, snapshot.ask_cum_cost, snapshot.ask_cum_size, quote_amount)
+        if quote_amount - spent > 1e-9 or acquired <= 0:
             return None, "insufficient ask depth", 0.0
         if spent < min_quote_required:
             return None, f"notional {spent:.8f} below minimum {min_quote_required:.8f}", 0.0
@@ -205,10 +448,9 @@ class PathEvaluator:
         vwap = spent / acquired
         if vwap <= 0:
             return None, "invalid VWAP", 0.0
-        effective_price = vwap * (1 + fee_rate)
+        effective_price = vwap * edge.one_plus_fee
         slippage_penalty = self._buy_slippage(snapshot, effective_price)
-        debug_log(
-            logger,
+        logger.debug(
             "leg %s side=%s in=%f out=%f vwap=%f",
             edge.market_code,
             "buy",
@@ -224,7 +466,7 @@ class PathEvaluator:
             input_amount=quote_amount,
             output_amount=acquired,
             fee_rate=fee_rate,
-            depth_used=tuple(depth_used),
+            depth_used=_depth_levels(snapshot.ask_px, snapshot.ask_sz, filled, partial) if debug else (),
         )
         return result, None, slippage_penalty
 
@@ -234,27 +476,11 @@ class PathEvaluator:
         snapshot: OrderbookSnapshot,
         base_amount: float,
         min_quote_required: float,
+        debug: bool = False,
     ) -> Tuple[Optional[LegResult], Optional[str], float]:
         assert base_amount > 0, f"Zero notional entering leg {edge.market_code}"
-        remaining = base_amount
-        proceeds = 0.0
-        depth_used: List[tuple[float, float]] = []
-        for level in snapshot.bids:
-            price = level.price
-            size = level.size
-            assert price > 0, f"Zero-price detected in {edge.market_code}"
-            if size <= 0:
-                continue
-            if size <= remaining:
-                proceeds += price * size
-                depth_used.append((price, size))
-                remaining -= size
-            else:
-                proceeds += price * remaining
-                depth_used.append((price, remaining))
-                remaining = 0.0
-                break
-        if remaining > 1e-9:
+        proceeds, sold, filled, partial = _walk_bids(snapshot.bid_px, snapshot.bid_cum_size, snapshot.bid_cum_value, base_amount)
+        if base_amount - sold > 1e-9:
             return None, "insufficient bid depth", 0.0
         if proceeds < min_quote_required:
             return None, f"notional {proceeds:.8f} below minimum {min_quote_required:.8f}", 0.0
@@ -262,10 +488,9 @@ class PathEvaluator:
         vwap = proceeds / base_amount if base_amount > 0 else 0.0
         if vwap <= 0:
             return None, "invalid VWAP", 0.0
-        effective_price = vwap * (1 - fee_rate)
+        effective_price = vwap * edge.one_minus_fee
         slippage_penalty = self._sell_slippage(snapshot, effective_price)
-        debug_log(
-            logger,
+        logger.debug(
             "leg %s side=%s in=%f out=%f vwap=%f",
             edge.market_code,
             "sell",
@@ -281,34 +506,10 @@ class PathEvaluator:
             input_amount=base_amount,
             output_amount=proceeds,
             fee_rate=fee_rate,
-            depth_used=tuple(depth_used),
+            depth_used=_depth_levels(snapshot.bid_px, snapshot.bid_sz, filled, partial) if debug else (),
         )
         return result, None, slippage_penalty
 
-    def _has_input_for_leg(self, amount_available: float, edge: MarketEdge, snapshot: OrderbookSnapshot) -> bool:
-        required = edge.min_total * self._safety_multiplier
-        if required <= 0:
-            return True
-        if edge.side == "buy":
-            return amount_available >= required
-        best_bid = snapshot.bids[0].price if snapshot.bids else 0.0
-        if best_bid <= 0:
-            debug_log(logger, "Invalid best bid for %s", edge.market_code)
-            return False
-        estimated_quote = amount_available * best_bid
-        return estimated_quote >= required
-
-    def _validate_snapshot(self, market_code: str, snapshot: OrderbookSnapshot) -> bool:
-        if not snapshot.bids or not snapshot.asks:
-            debug_log(logger, "Empty orderbook for %s", market_code)
-            return False
-        best_bid = snapshot.bids[0].price
-        best_ask = snapshot.asks[0].price
-        if best_bid <= 0 or best_ask <= 0:
-            debug_log(logger, "Non-positive best levels for %s bid=%s ask=%s", market_code, best_bid, best_ask)
-            return False
-        return True
-
     def _compute_vol_penalty(self, assets: Sequence[str], sigma_by_asset: Mapping[str, float]) -> float:
         relevant = [asset for asset in assets if asset != "USD"]
         if not relevant:
@@ -317,13 +518,13 @@ class PathEvaluator:
         return self._config.risk_model.vol_risk_multiplier * sigma
 
     def _buy_slippage(self, snapshot: OrderbookSnapshot, effective_price: float) -> float:
-        best_ask = snapshot.asks[0].price if snapshot.asks else 0.0
+        best_ask = snapshot.best_ask
         if best_ask <= 0:
             return 0.0
         return max(0.0, (effective_price - best_ask) / best_ask)
 
     def _sell_slippage(self, snapshot: OrderbookSnapshot, effective_price: float) -> float:
-        best_bid = snapshot.bids[0].price if snapshot.bids else 0.0
+        best_bid = snapshot.best_bid
         if best_bid <= 0:
             return 0.0
         return max(0.0, (best_bid - effective_price) / best_bid)
@@ -345,8 +546,8 @@ class PathEvaluator:
             snapshot = snapshots.get(edge.market_code)
             if not snapshot:
                 continue
-            bids = [(level.price, level.size) for level in snapshot.bids[:depth]]
-            asks = [(level.price, level.size) for level in snapshot.asks[:depth]]
+            bids = list(zip(snapshot.bid_px[:depth].tolist(), snapshot.bid_sz[:depth].tolist()))
+            asks = list(zip(snapshot.ask_px[:depth].tolist(), snapshot.ask_sz[:depth].tolist()))
             views[edge.market_code] = {"bids": bids, "asks": asks}
         return views
 
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Sequence, Set
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, FrozenSet, List, Mapping, Sequence, Tuple
+
+import numpy as np
 
 from .market_graph import MarketGraph, MarketEdge
 from .config import Config
@@ -12,6 +15,13 @@ class PathDefinition:
     path_id: str
     edges: Sequence[MarketEdge]
     assets: Sequence[str]
+    market_idx: np.ndarray = field(compare=False, repr=False)
+    direction_mask: np.ndarray = field(compare=False, repr=False)
+    min_total_arr: np.ndarray = field(compare=False, repr=False)
+    bid_fee_arr: np.ndarray = field(compare=False, repr=False)
+    ask_fee_arr: np.ndarray = field(compare=False, repr=False)
+    multiplier_arr: np.ndarray = field(compare=False, repr=False)
+    price_mul_arr: np.ndarray = field(compare=False, repr=False)
 
 
 class PathModel:
@@ -19,95 +29,182 @@ class PathModel:
     def __init__(self, graph: MarketGraph, config: Config) -> None:
         self._graph = graph
         self._config = config
-        self._paths = self._build_paths()
+        self._paths = tuple(self._build_paths())
+        self._build_leg_arrays()
 
     @property
     def paths(self) -> Sequence[PathDefinition]:
-        return tuple(self._paths)
+        return self._paths
 
-    def markets_in_use(self) -> Set[str]:
-        mk = set()
-        for path in self._paths:
-            for e in path.edges:
-                mk.add(e.market_code)
-        return mk
+    @property
+    def market_codes(self) -> Tuple[str, ...]:
+        return self._market_codes
 
-    def assets_in_paths(self) -> Set[str]:
-        a = set()
-        for p in self._paths:
-            a.update(p.assets)
-        return a
+    @property
+    def market_index(self) -> Mapping[str, int]:
+        return self._market_index
 
-    def _build_paths(self) -> Sequence[PathDefinition]:
-        start_asset = "USD"
-        paths: List[PathDefinition] = []
-        tokens = self._config.tokens
-        path_id = 0
+    @property
+    def path_lengths(self) -> np.ndarray:
+        return self._path_lengths
 
-        def dfs(
-            current_asset: str,
-            edges: List[MarketEdge],
-            assets: List[str],
-            visited: Set[str],
-            must_return_to_usd: bool,
-        ) -> None:
-            nonlocal path_id
+    @property
+    def edge_market_idx(self) -> np.ndarray:
+        return self._edge_market_idx
 
-            if len(edges) >= self._config.paths.max_length:
-                return
+    @property
+    def edge_is_buy(self) -> np.ndarray:
+        return self._edge_is_buy
 
-            for edge in self._graph.out_edges(current_asset):
+    @property
+    def edge_min_quote(self) -> np.ndarray:
+        return self._edge_min_quote
 
-                if must_return_to_usd and edge.to_asset != start_asset:
-                    continue
+    @property
+    def edge_safety_min(self) -> np.ndarray:
+        return self._edge_safety_min
 
-                next_asset = edge.to_asset
-                token_rule = tokens.get(next_asset)
-                if next_asset != start_asset:
-                    if not token_rule or not token_rule.enabled:
-                        continue
-                    if not token_rule.allowed_as_terminal_asset and not token_rule.allowed_as_bridge:
-                        continue
+    @property
+    def edge_price_mul(self) -> np.ndarray:
+        return self._edge_price_mul
 
-                if (
-                    not self._config.paths.allow_revisit_nodes
-                    and next_asset in visited
-                    and next_asset != start_asset
-                ):
-                    continue
-
-                edges.append(edge)
-                assets.append(next_asset)
-
-                if next_asset == start_asset and len(edges) >= self._config.paths.min_length:
-                    path_id += 1
-                    paths.append(
-                        PathDefinition(
-                            path_id=f"path_{path_id}",
-                            edges=tuple(edges),
-                            assets=tuple(assets),
-                        )
-                    )
-
-                elif len(edges) < self._config.paths.max_length:
-                    if next_asset != start_asset:
-                        visited.add(next_asset)
+    @property
+    def path_fee_total(self) -> np.ndarray:
+        return self._path_fee_total
 
-                    require_return = False
-                    if next_asset != start_asset:
-                        rule = tokens.get(next_asset)
-                        require_return = not rule.allowed_as_bridge
+    @property
+    def asset_codes(self) -> Tuple[str, ...]:
+        return self._asset_codes
 
-                    dfs(next_asset, edges, assets, visited, require_return)
+    @property
+    def path_asset_idx(self) -> np.ndarray:
+        return self._path_asset_idx
+
+    @cached_property
+    def markets_in_use(self) -> FrozenSet[str]:
+        return frozenset(self._market_codes)
+
+    @cached_property
+    def assets_in_paths(self) -> FrozenSet[str]:
+        return frozenset(asset for path in self._paths for asset in path.assets)
+
+    def _make_path(
+        self,
+        path_id: str,
+        edges: Tuple[MarketEdge, ...],
+        assets: Tuple[str, ...],
+        market_idx: Dict[str, int],
+    ) -> PathDefinition:
+        safety = self._config.min_order.min_notional_multiplier
+        multipliers = np.full(len(edges), safety, dtype=np.float64)
+        multipliers[0] = self._config.min_order.first_leg_multiplier
+        return PathDefinition(
+            path_id=path_id,
+            edges=edges,
+            assets=assets,
+            market_idx=np.array([market_idx[e.market_code] for e in edges], dtype=np.int32),
+            direction_mask=np.array([not e.is_buy for e in edges], dtype=np.uint8),
+            min_total_arr=np.array([e.min_total for e in edges], dtype=np.float64),
+            bid_fee_arr=np.array([e.bid_fee for e in edges], dtype=np.float64),
+            ask_fee_arr=np.array([e.ask_fee for e in edges], dtype=np.float64),
+            multiplier_arr=multipliers,
+            price_mul_arr=np.array(
+                [e.one_plus_fee if e.is_buy else e.one_minus_fee for e in edges], dtype=np.float64
+            ),
+        )
+
+    def _build_leg_arrays(self) -> None:
+        # (path, leg) matrices padded to the longest path; padding legs use
+        # market index -1 and are never read because of path_lengths.
+        n_paths = len(self._paths)
+        max_len = max((len(path.edges) for path in self._paths), default=0)
+        safety = self._config.min_order.min_notional_multiplier
+        self._path_lengths = np.array([len(path.edges) for path in self._paths], dtype=np.int32)
+        self._edge_market_idx = np.full((n_paths, max_len), -1, dtype=np.int32)
+        self._edge_is_buy = np.zeros((n_paths, max_len), dtype=bool)
+        self._edge_min_quote = np.zeros((n_paths, max_len), dtype=np.float64)
+        self._edge_safety_min = np.zeros((n_paths, max_len), dtype=np.float64)
+        self._edge_price_mul = np.ones((n_paths, max_len), dtype=np.float64)
+        self._path_fee_total = np.zeros(n_paths, dtype=np.float64)
+        # Asset padding points one past asset_codes, where per-asset vectors
+        # keep a neutral 0.0 entry.
+        self._asset_codes = tuple(sorted(self.assets_in_paths))
+        asset_idx = {asset: i for i, asset in enumerate(self._asset_codes)}
+        self._path_asset_idx = np.full((n_paths, max_len + 1), len(self._asset_codes), dtype=np.int32)
+        for row, path in enumerate(self._paths):
+            n = len(path.edges)
+            is_buy = path.direction_mask == 0
+            self._edge_market_idx[row, :n] = path.market_idx
+            self._edge_is_buy[row, :n] = is_buy
+            self._edge_min_quote[row, :n] = path.min_total_arr * path.multiplier_arr
+            self._edge_safety_min[row, :n] = path.min_total_arr * safety
+            self._edge_price_mul[row, :n] = path.price_mul_arr
+            self._path_fee_total[row] = np.where(is_buy, path.bid_fee_arr, path.ask_fee_arr).sum()
+            self._path_asset_idx[row, :n + 1] = [asset_idx[asset] for asset in path.assets]
 
-                    if next_asset != start_asset:
-                        visited.discard(next_asset)
+    def _build_paths(self) -> Sequence[PathDefinition]:
+        start_asset = "USD"
+        tokens = self._config.tokens
+        min_length = self._config.paths.min_length
+        max_length = self._config.paths.max_length
+        allow_revisit = self._config.paths.allow_revisit_nodes
+        asset_bits: Dict[str, int] = {}
+        memo: Dict[Tuple[str, int, int, bool], Tuple[Tuple[MarketEdge, ...], ...]] = {}
 
-                edges.pop()
-                assets.pop()
+        def suffixes(
+            current_asset: str,
+            depth: int,
+            visited: int,
+            must_return_to_usd: bool,
+        ) -> Tuple[Tuple[MarketEdge, ...], ...]:
+            # Every way back to USD from current_asset after `depth` legs. The
+            # result only depends on the key, so shared subtrees expand once.
+            key = (current_asset, depth, visited, must_return_to_usd)
+            cached = memo.get(key)
+            if cached is not None:
+                return cached
+
+            result: List[Tuple[MarketEdge, ...]] = []
+            if depth < max_length:
+                for edge in self._graph.out_edges(current_asset):
+
+                    if must_return_to_usd and edge.to_asset != start_asset:
+                        continue
 
-        dfs(start_asset, [], [start_asset], set(), False)
-        return paths
+                    next_asset = edge.to_asset
+                    next_visited = visited
+                    require_return = False
+                    if next_asset != start_asset:
+                        token_rule = tokens.get(next_asset)
+                        if not token_rule or not token_rule.enabled:
+                            continue
+                        if not token_rule.allowed_as_terminal_asset and not token_rule.allowed_as_bridge:
+                            continue
+                        bit = asset_bits.setdefault(next_asset, 1 << len(asset_bits))
+                        if not allow_revisit:
+                            if visited & bit:
+                                continue
+                            next_visited = visited | bit
+                        require_return = not token_rule.allowed_as_bridge
+
+                    if next_asset == start_asset and depth + 1 >= min_length:
+                        result.append((edge,))
+                    elif depth + 1 < max_length:
+                        for rest in suffixes(next_asset, depth + 1, next_visited, require_return):
+                            result.append((edge,) + rest)
+
+            memo[key] = tuple(result)
+            return memo[key]
+
+        found: List[Tuple[Tuple[MarketEdge, ...], Tuple[str, ...]]] = []
+        for edges in suffixes(start_asset, 0, 0, False):
+            found.append((edges, (start_asset,) + tuple(e.to_asset for e in edges)))
+        self._market_codes = tuple(sorted({e.market_code for edges, _ in found for e in edges}))
+        self._market_index = {code: i for i, code in enumerate(self._market_codes)}
+        return [
+            self._make_path(f"path_{i}", edges, assets, self._market_index)
+            for i, (edges, assets) in enumerate(found, start=1)
+        ]
 
 
 __all__ = ["PathModel", "PathDefinition"]
@@ -1,29 +1,81 @@
 from __future__ import annotations
 
-import asyncio
 import math
-from collections import defaultdict, deque
-from dataclasses import dataclass
-from typing import Deque, Dict, Iterable
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
 
 from meatna.exchange.models import Ticker
 
 from .config import Config, DEFAULT_SIGMA_BY_TIER, TokenRule
-from ..utils.math_utils import log_return
 
 
-@dataclass
-class PriceSample:
-    timestamp_ms: int
-    price: float
+class RingBuffer:
+
+    __slots__ = ("ts", "px", "head", "size")
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.ts = np.empty(capacity, dtype=np.int64)
+        self.px = np.empty(capacity, dtype=np.float64)
+        self.head = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, timestamp_ms: int, price: float) -> None:
+        cap = self.ts.shape[0]
+        if self.size == cap:
+            self._grow(cap * 2)
+            cap = self.ts.shape[0]
+        slot = (self.head + self.size) % cap
+        self.ts[slot] = timestamp_ms
+        self.px[slot] = price
+        self.size += 1
+
+    def drop_before(self, cutoff: int) -> None:
+        # Drops the leading run of samples older than cutoff, stopping at the
+        # first one that isn't, so out-of-order timestamps behave like the
+        # old popleft loop.
+        cap = self.ts.shape[0]
+        while self.size:
+            end = min(self.head + self.size, cap)
+            span = end - self.head
+            fresh = self.ts[self.head:end] >= cutoff
+            n = int(fresh.argmax()) if fresh.any() else span
+            self.head = (self.head + n) % cap
+            self.size -= n
+            if n < span:
+                break
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        end = self.head + self.size
+        cap = self.ts.shape[0]
+        if end <= cap:
+            return self.ts[self.head:end], self.px[self.head:end]
+        wrap = end - cap
+        return (
+            np.concatenate((self.ts[self.head:], self.ts[:wrap])),
+            np.concatenate((self.px[self.head:], self.px[:wrap])),
+        )
+
+    def _grow(self, capacity: int) -> None:
+        ts, px = self.arrays()
+        self.ts = np.empty(capacity, dtype=np.int64)
+        self.px = np.empty(capacity, dtype=np.float64)
+        self.ts[: self.size] = ts
+        self.px[: self.size] = px
+        self.head = 0
 
 
 class VolatilityCache:
 
     def __init__(self, config: Config) -> None:
         self._config = config
-        self._samples: Dict[str, Deque[PriceSample]] = defaultdict(deque)
-        self._lock = asyncio.Lock()
+        # Windows are only touched from the event loop and each update appends
+        # and prunes without awaiting, so readers never see a half-applied
+        # update and need no asyncio.Lock.
+        self._samples: Dict[str, RingBuffer] = {}
 
     async def update_from_ticker(self, ticker: Ticker) -> None:
         market = ticker.market
@@ -34,59 +86,46 @@ class VolatilityCache:
             return
         price = float(ticker.trade_price)
         timestamp = int(ticker.timestamp)
-        sample = PriceSample(timestamp_ms=timestamp, price=price)
-        async with self._lock:
-            window = self._samples[base]
-            window.append(sample)
-            self._prune(window, timestamp)
+        window = self._samples.get(base)
+        if window is None:
+            window = self._samples[base] = RingBuffer()
+        window.append(timestamp, price)
+        self._prune(window, timestamp)
 
-    def _prune(self, window: Deque[PriceSample], now: int) -> None:
+    def _prune(self, window: RingBuffer, now: int) -> None:
         cutoff = now - int(self._config.risk_model.volatility_window_seconds * 1000)
-        while window and window[0].timestamp_ms < cutoff:
-            window.popleft()
+        window.drop_before(cutoff)
 
     async def get_sigma(self, asset: str) -> float:
-        async with self._lock:
-            window = self._samples.get(asset)
-            return self._sigma_from_window(asset, window)
+        return self._sigma_from_window(asset, self._samples.get(asset))
 
     async def snapshot_sigmas(self, assets: Iterable[str]) -> Dict[str, float]:
-        async with self._lock:
-            return {asset: self._sigma_from_window(asset, self._samples.get(asset)) for asset in assets}
+        samples = self._samples
+        return {asset: self._sigma_from_window(asset, samples.get(asset)) for asset in assets}
 
     def _default_sigma(self, asset: str) -> float:
         token_rule: TokenRule | None = self._config.tokens.get(asset)
         tier = token_rule.volatility_tier if token_rule else 3
         return DEFAULT_SIGMA_BY_TIER.get(tier, 0.005)
 
-    def _sigma_from_window(self, asset: str, window: Deque[PriceSample] | None) -> float:
+    def _sigma_from_window(self, asset: str, window: RingBuffer | None) -> float:
         if not window or len(window) < 2:
             return self._default_sigma(asset)
-        samples = list(window)
-        returns: list[float] = []
-        deltas: list[float] = []
-        for previous, current in zip(samples, samples[1:]):
-            if current.price <= 0 or previous.price <= 0:
-                continue
-            returns.append(log_return(current.price, previous.price))
-            if current.timestamp_ms > previous.timestamp_ms:
-                deltas.append((current.timestamp_ms - previous.timestamp_ms) / 1000)
-        if not returns:
+        timestamps, prices = window.arrays()
+        valid = (prices[:-1] > 0) & (prices[1:] > 0)
+        if not valid.any():
             return self._default_sigma(asset)
+        returns = np.log(prices[1:][valid] / prices[:-1][valid])
+        deltas = np.diff(timestamps)[valid]
+        deltas = deltas[deltas > 0] / 1000
         avg_delta = (
-            sum(deltas) / len(deltas) if deltas else self._config.risk_model.volatility_sampling_interval_seconds
+            float(deltas.mean()) if deltas.size else self._config.risk_model.volatility_sampling_interval_seconds
         )
-        variance = 0.0
-        mean = sum(returns) / len(returns)
-        for value in returns:
-            variance += (value - mean) ** 2
-        variance /= len(returns)
-        sigma = math.sqrt(max(variance, 0.0))
+        sigma = float(returns.std())
         if avg_delta <= 0:
             avg_delta = self._config.risk_model.volatility_sampling_interval_seconds
         sigma_per_sec = sigma / math.sqrt(avg_delta)
         return float(sigma_per_sec)
 
     async def has_data(self) -> bool:
-        async with self._lock:
-            return any(self._samples.values())
+        return any(self._samples.values())
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import ccxt.async_support as ccxt
 
 from meatna.core.config_loader import load_secrets
-from meatna.exchange.models import Orderbook, OrderbookLevel, MarketInfo
+from meatna.exchange.models import Orderbook, MarketInfo
 
 
 class CcxtUnifiedClient:
@@ -15,9 +15,11 @@ class CcxtUnifiedClient:
         self,
         loop: Optional[asyncio.AbstractEventLoop] = None,
         exchanges: Optional[List[str]] = None,
+        orderbook_depth: int = 25,
     ) -> None:
 
         self.loop = loop or asyncio.get_event_loop()
+        self._ob_depth = orderbook_depth
 
         secrets = load_secrets()
 
@@ -46,8 +48,9 @@ class CcxtUnifiedClient:
     async def load_markets(self) -> None:
         out: Dict[str, Dict[str, MarketInfo]] = {}
 
-        for ex_name, client in self.exchanges.items():
-            raw = await client.load_markets()
+        results = await asyncio.gather(*(client.load_markets() for client in self.exchanges.values()))
+
+        for ex_name, raw in zip(self.exchanges, results):
             mk: Dict[str, MarketInfo] = {}
 
             for symbol, info in raw.items():
@@ -78,19 +81,23 @@ class CcxtUnifiedClient:
         quote, base = market_code.split("-")
         symbol = f"{base}/{quote}"
 
-        ob = await self.exchanges[exchange].fetch_order_book(symbol, limit=25)
+        ob = await self.exchanges[exchange].fetch_order_book(symbol, limit=self._ob_depth)
         if not ob:
             return None
 
-        bids = [OrderbookLevel(float(p), float(q)) for p, q in ob.get("bids", [])]
-        asks = [OrderbookLevel(float(p), float(q)) for p, q in ob.get("asks", [])]
+        return Orderbook.from_levels(
+            market_code,
+            ob.get("bids"),
+            ob.get("asks"),
+            int(ob.get("timestamp") or 0),
+        )
 
-        return Orderbook(
-            market=market_code,
-            bids=bids,
-            asks=asks,
-            timestamp=int(ob.get("timestamp") or 0),
+    async def fetch_orderbooks(self, requests: Sequence[Tuple[str, str]]) -> List[Optional[Orderbook]]:
+        results = await asyncio.gather(
+            *(self.fetch_orderbook(exchange, market_code) for exchange, market_code in requests),
+            return_exceptions=True,
         )
+        return [None if isinstance(r, Exception) else r for r in results]
 
     async def fetch_balance(self, exchange: str) -> Dict[str, float]:
         if exchange not in self.exchanges:
@@ -112,7 +119,7 @@ class CcxtUnifiedClient:
         for client in self.exchanges.values():
             try:
                 await client.close()
-            except:
+            except Exception:
                 pass
 
 
@@ -122,9 +129,11 @@ class CcxtMultiClient:
         self,
         loop: Optional[asyncio.AbstractEventLoop] = None,
         exchanges: Optional[List[str]] = None,
+        orderbook_depth: int = 25,
     ) -> None:
 
         self.loop = loop or asyncio.get_event_loop()
+        self._ob_depth = orderbook_depth
 
         secrets = load_secrets()
 
@@ -150,8 +159,9 @@ class CcxtMultiClient:
     async def load_markets(self) -> None:
         out = {}
 
-        for ex_name, client in self.exchanges.items():
-            raw = await client.load_markets()
+        results = await asyncio.gather(*(client.load_markets() for client in self.exchanges.values()))
+
+        for ex_name, raw in zip(self.exchanges, results):
             mks = {}
 
             for symbol, info in raw.items():
@@ -179,19 +189,23 @@ class CcxtMultiClient:
         quote, base = market_code.split("-")
         symbol = f"{base}/{quote}"
 
-        ob = await self.exchanges[exchange].fetch_order_book(symbol, limit=25)
+        ob = await self.exchanges[exchange].fetch_order_book(symbol, limit=self._ob_depth)
         if not ob:
             return None
 
-        bids = [OrderbookLevel(float(p), float(q)) for p, q in ob.get("bids", [])]
-        asks = [OrderbookLevel(float(p), float(q)) for p, q in ob.get("asks", [])]
+        return Orderbook.from_levels(
+            market_code,
+            ob.get("bids"),
+            ob.get("asks"),
+            int(ob.get("timestamp") or 0),
+        )
 
-        return Orderbook(
-            market=market_code,
-            bids=bids,
-            asks=asks,
-            timestamp=int(ob.get("timestamp") or 0),
+    async def fetch_orderbooks(self, requests: Sequence[Tuple[str, str]]) -> List[Optional[Orderbook]]:
+        results = await asyncio.gather(
+            *(self.fetch_orderbook(exchange, market_code) for exchange, market_code in requests),
+            return_exceptions=True,
         )
+        return [None if isinstance(r, Exception) else r for r in results]
 
     async def fetch_balance(self, exchange: str) -> Dict[str, float]:
         if exchange not in self.exchanges:
@@ -213,5 +227,5 @@ class CcxtMultiClient:
         for client in self.exchanges.values():
             try:
                 await client.close()
-            except:
+            except Exception:
                 pass
@@ -1,31 +1,65 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List
+from typing import Sequence, Tuple
 
+import numpy as np
 
-@dataclass
+_EMPTY_LEVELS = np.empty(0, dtype=np.float64)
+
+
+def _level_arrays(levels: Sequence[Sequence[float]] | None) -> Tuple[np.ndarray, np.ndarray]:
+    arr = np.asarray(levels or (), dtype=np.float64)
+    if arr.ndim != 2 or not arr.shape[0]:
+        return _EMPTY_LEVELS, _EMPTY_LEVELS
+    px, sz = np.ascontiguousarray(arr[:, :2].T)
+    return px, sz
+
+
+@dataclass(frozen=True, slots=True)
 class Ticker:
     market: str
     timestamp: int
     trade_price: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MarketInfo:
     market: str
     base_currency: str
     quote_currency: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OrderbookLevel:
     price: float
     size: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Orderbook:
     market: str
-    bids: List[OrderbookLevel]
-    asks: List[OrderbookLevel]
+    bid_px: np.ndarray
+    bid_sz: np.ndarray
+    ask_px: np.ndarray
+    ask_sz: np.ndarray
     timestamp: int
+
+    @classmethod
+    def from_levels(
+        cls,
+        market: str,
+        bids: Sequence[Sequence[float]] | None,
+        asks: Sequence[Sequence[float]] | None,
+        timestamp: int,
+    ) -> "Orderbook":
+        bid_px, bid_sz = _level_arrays(bids)
+        ask_px, ask_sz = _level_arrays(asks)
+        return cls(market, bid_px, bid_sz, ask_px, ask_sz, timestamp)
+
+    @property
+    def bids(self) -> Tuple[OrderbookLevel, ...]:
+        return tuple(map(OrderbookLevel, self.bid_px.tolist(), self.bid_sz.tolist()))
+
+    @property
+    def asks(self) -> Tuple[OrderbookLevel, ...]:
+        return tuple(map(OrderbookLevel, self.ask_px.tolist(), self.ask_sz.tolist()))
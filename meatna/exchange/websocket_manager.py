@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import Dict, List, Optional, Set
 from datetime import datetime
 
+import numpy as np
+
 try:
     import ccxt.pro as ccxtpro
     CCXT_PRO_AVAILABLE = True
@@ -13,8 +16,7 @@ except ImportError:
     ccxtpro = None
 
 from meatna.core.config_loader import load_secrets
-from meatna.core.orderbook_cache import OrderbookCache, OrderbookSnapshot
-from meatna.exchange.models import OrderbookLevel
+from meatna.core.orderbook_cache import OrderbookCache
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +26,8 @@ class WebSocketManager:
     def __init__(
         self,
         caches: Dict[str, OrderbookCache],
-        exchanges: Optional[List[str]] = None
+        exchanges: Optional[List[str]] = None,
+        orderbook_depth: int = 25,
     ):
         if not CCXT_PRO_AVAILABLE:
             raise ImportError(
@@ -33,6 +36,7 @@ class WebSocketManager:
             )
 
         self.caches = caches
+        self._ob_depth = orderbook_depth
         self.exchanges: Dict[str, ccxtpro.Exchange] = {}
         self._tasks: List[asyncio.Task] = []
         self._running = False
@@ -56,12 +60,12 @@ class WebSocketManager:
                     "apiKey": api_key,
                     "secret": api_secret,
                     "enableRateLimit": True,
-                    "newUpdates": True,
+                    "newUpdates": False,
                 })
                 self.exchanges[name] = client
-                logger.info(f"✅ WebSocket client created: {name}")
+                logger.info("✅ WebSocket client created: %s", name)
             except Exception as e:
-                logger.error(f"❌ Failed to create WebSocket client for {name}: {e}")
+                logger.error("❌ Failed to create WebSocket client for %s: %s", name, e)
 
     async def subscribe_orderbooks(
         self,
@@ -70,23 +74,106 @@ class WebSocketManager:
         stop_event: asyncio.Event
     ) -> None:
         if exchange not in self.exchanges:
-            logger.warning(f"Exchange {exchange} not available")
+            logger.warning("Exchange %s not available", exchange)
             return
 
         client = self.exchanges[exchange]
         cache = self.caches[exchange]
 
-        logger.info(f"📡 Subscribing to {len(markets)} markets on {exchange}")
+        logger.info("📡 Subscribing to %d markets on %s", len(markets), exchange)
 
-        tasks = []
-        for market in markets:
-            task = asyncio.create_task(
-                self._watch_orderbook(client, cache, exchange, market, stop_event)
-            )
-            tasks.append(task)
+        writer = asyncio.create_task(cache.run_writer())
+        try:
+            if client.has.get("watchOrderBookForSymbols"):
+                await self._watch_orderbooks(client, cache, exchange, markets, stop_event)
+            else:
+                tasks = []
+                for market in markets:
+                    task = asyncio.create_task(
+                        self._watch_orderbook(client, cache, exchange, market, stop_event)
+                    )
+                    tasks.append(task)
+
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+        logger.info(
+            "🛑 Stopped watching %d markets on %s (%d stale updates dropped)",
+            len(markets),
+            exchange,
+            cache.dropped_updates,
+        )
+
+    async def _watch_orderbooks(
+        self,
+        client: ccxtpro.Exchange,
+        cache: OrderbookCache,
+        exchange: str,
+        symbols: List[str],
+        stop_event: asyncio.Event
+    ) -> None:
+        # One multiplexed subscription per exchange; each await yields whichever
+        # book changed, routed back to its market code by symbol.
+        market_codes: Dict[str, str] = {}
+        for symbol in symbols:
+            try:
+                base, quote = symbol.split("/")
+            except ValueError:
+                logger.error("Invalid symbol format: %s", symbol)
+                continue
+            market_codes[symbol] = f"{quote}-{base}"
 
-        await asyncio.gather(*tasks, return_exceptions=True)
-        logger.info(f"🛑 Stopped watching {len(markets)} markets on {exchange}")
+        if not market_codes:
+            return
+
+        watched = list(market_codes)
+        update_count = 0
+        error_count = 0
+        max_errors = 10
+
+        while not stop_event.is_set() and error_count < max_errors:
+            try:
+                orderbook = await client.watch_order_book_for_symbols(watched, limit=self._ob_depth)
+
+                market_code = market_codes.get(orderbook.get("symbol")) if orderbook else None
+                if market_code is None:
+                    continue
+
+                bids = np.asarray(orderbook.get('bids') or (), dtype=np.float64)
+                asks = np.asarray(orderbook.get('asks') or (), dtype=np.float64)
+                if not bids.size or not asks.size:
+                    continue
+
+                cache.submit(exchange, market_code, bids, asks, received_ns=time.monotonic_ns())
+                update_count += 1
+
+                if update_count <= 3:
+                    logger.info(
+                        "  ✓ %s::%s updated (bid=%.2f, ask=%.2f)",
+                        exchange,
+                        market_code,
+                        bids[0, 0],
+                        asks[0, 0],
+                    )
+
+                error_count = 0
+
+            except Exception as e:
+                error_count += 1
+                logger.debug(
+                    "Error watching %s orderbooks (error %d/%d): %s",
+                    exchange,
+                    error_count,
+                    max_errors,
+                    e,
+                )
+                await asyncio.sleep(1.0)
+
+        if error_count >= max_errors:
+            logger.error(
+                "❌ Too many errors for %s orderbooks, stopped watching", exchange
+            )
 
     async def _watch_orderbook(
         self,
@@ -98,10 +185,10 @@ class WebSocketManager:
     ) -> None:
         try:
             base, quote = symbol.split("/")
-            market_code = f"{quote}-{base}"
-        except:
-            logger.error(f"Invalid symbol format: {symbol}")
+        except ValueError:
+            logger.error("Invalid symbol format: %s", symbol)
             return
+        market_code = f"{quote}-{base}"
 
         update_count = 0
         error_count = 0
@@ -109,54 +196,44 @@ class WebSocketManager:
 
         while not stop_event.is_set() and error_count < max_errors:
             try:
-                orderbook = await client.watch_order_book(symbol, limit=25)
-
-                if not orderbook or not orderbook.get('bids') or not orderbook.get('asks'):
-                    await asyncio.sleep(0.1)
+                orderbook = await client.watch_order_book(symbol, limit=self._ob_depth)
+                if not orderbook:
                     continue
 
-                bids = tuple([
-                    OrderbookLevel(float(p), float(q))
-                    for p, q in orderbook['bids']
-                ])
-                asks = tuple([
-                    OrderbookLevel(float(p), float(q))
-                    for p, q in orderbook['asks']
-                ])
-
-                snapshot = OrderbookSnapshot(
-                    exchange=exchange,
-                    market=market_code,
-                    bids=bids,
-                    asks=asks,
-                    timestamp_ms=int(orderbook.get('timestamp', 0)),
-                )
+                bids = np.asarray(orderbook.get('bids') or (), dtype=np.float64)
+                asks = np.asarray(orderbook.get('asks') or (), dtype=np.float64)
+                if not bids.size or not asks.size:
+                    continue
 
-                await cache.update_snapshot(snapshot)
+                cache.submit(exchange, market_code, bids, asks, received_ns=time.monotonic_ns())
                 update_count += 1
 
                 if update_count <= 3:
                     logger.info(
-                        f"  ✓ {exchange}::{market_code} updated "
-                        f"(bid={bids[0].price:.2f}, ask={asks[0].price:.2f})"
+                        "  ✓ %s::%s updated (bid=%.2f, ask=%.2f)",
+                        exchange,
+                        market_code,
+                        bids[0, 0],
+                        asks[0, 0],
                     )
 
                 error_count = 0
 
-            except asyncio.CancelledError:
-                logger.debug(f"Watch cancelled for {exchange}::{market_code}")
-                break
             except Exception as e:
                 error_count += 1
                 logger.debug(
-                    f"Error watching {exchange}::{market_code} "
-                    f"(error {error_count}/{max_errors}): {e}"
+                    "Error watching %s::%s (error %d/%d): %s",
+                    exchange,
+                    market_code,
+                    error_count,
+                    max_errors,
+                    e,
                 )
                 await asyncio.sleep(1.0)
 
         if error_count >= max_errors:
             logger.error(
-                f"❌ Too many errors for {exchange}::{market_code}, stopped watching"
+                "❌ Too many errors for %s::%s, stopped watching", exchange, market_code
             )
 
     async def start(
@@ -180,17 +257,14 @@ class WebSocketManager:
 
             try:
                 quote, base = market_code.split("-")
-                symbol = f"{base}/{quote}"
-
-                if exchange not in exchange_markets:
-                    exchange_markets[exchange] = []
-                exchange_markets[exchange].append(symbol)
-            except:
+            except ValueError:
                 continue
 
+            exchange_markets.setdefault(exchange, []).append(f"{base}/{quote}")
+
         tasks = []
         for exchange, symbols in exchange_markets.items():
-            logger.info(f"  → {exchange}: {len(symbols)} markets")
+            logger.info("  → %s: %d markets", exchange, len(symbols))
             task = asyncio.create_task(
                 self.subscribe_orderbooks(exchange, symbols, stop_event)
             )
@@ -209,13 +283,18 @@ class WebSocketManager:
         for task in self._tasks:
             if not task.done():
                 task.cancel()
-
-        for name, client in self.exchanges.items():
-            try:
-                await client.close()
-                logger.info(f"  ✓ Closed {name}")
-            except Exception as e:
-                logger.debug(f"  ✗ Error closing {name}: {e}")
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        names = list(self.exchanges)
+        results = await asyncio.gather(
+            *(client.close() for client in self.exchanges.values()),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.debug("  ✗ Error closing %s: %s", name, result)
+            else:
+                logger.info("  ✓ Closed %s", name)
 
         self.exchanges.clear()
         self._tasks.clear()
@@ -223,6 +302,7 @@ class WebSocketManager:
 
 async def create_websocket_manager(
     caches: Dict[str, OrderbookCache],
-    exchanges: Optional[List[str]] = None
+    exchanges: Optional[List[str]] = None,
+    orderbook_depth: int = 25,
 ) -> WebSocketManager:
-    return WebSocketManager(caches, exchanges)
+    return WebSocketManager(caches, exchanges, orderbook_depth)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import time
+from typing import Optional, Tuple
+
 from bithumb.client import BithumbRESTClient
 from bithumb.credentials import load_credentials
 
@@ -8,9 +11,11 @@ from meatna.core.balance import QuoteBalances
 
 class AccountService:
 
-    def __init__(self) -> None:
+    def __init__(self, cache_ttl_sec: float = 0.25) -> None:
         creds = load_credentials()
         self._client = BithumbRESTClient(access_key=creds.access_key, secret_key=creds.secret_key)
+        self._ttl = cache_ttl_sec
+        self._cache: Optional[Tuple[float, QuoteBalances]] = None
 
     async def __aenter__(self) -> "AccountService":
         return self
@@ -21,13 +26,22 @@ class AccountService:
     async def close(self) -> None:
         await self._client.aclose()
 
+    def invalidate(self) -> None:
+        # Call after fills so the next read reflects the trade.
+        self._cache = None
+
     async def fetch_balances(self) -> QuoteBalances:
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache[0] < self._ttl:
+            return self._cache[1]
         accounts = await self._client.private.get_accounts()
         balance_map = {acct.currency.upper(): acct for acct in accounts}
         krw = self._available(balance_map.get("KRW"))
         btc = self._available(balance_map.get("BTC"))
         usdt = self._available(balance_map.get("USDT"))
-        return QuoteBalances(krw=krw, btc=btc, usdt=usdt)
+        balances = QuoteBalances(krw=krw, btc=btc, usdt=usdt)
+        self._cache = (now, balances)
+        return balances
 
     @staticmethod
     def _available(account) -> float:
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import ssl
+
+import aiohttp
+import certifi
+
+
+def create_shared_session(limit: int = 64, ttl_dns_cache: int = 300) -> aiohttp.ClientSession:
+    # One connection pool for every ccxt REST client, so TLS sessions and DNS
+    # lookups stay warm across pollers. ccxt leaves injected sessions open on
+    # close(); the owner closes this one.
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        ttl_dns_cache=ttl_dns_cache,
+        ssl=ssl.create_default_context(cafile=certifi.where()),
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+__all__ = ["create_shared_session"]
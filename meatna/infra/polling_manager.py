@@ -2,17 +2,29 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Sequence
+from typing import Dict, Sequence
 
+import aiohttp
 import ccxt.async_support as ccxt
 
-from meatna.exchange.models import OrderbookLevel, Ticker
+from meatna.exchange.models import Ticker
 from meatna.core.orderbook_cache import OrderbookCache
 from meatna.core.volatility_cache import VolatilityCache
 
 logger = logging.getLogger(__name__)
 
 
+def _symbol_table(markets: Sequence[str]) -> Dict[str, str]:
+    symbols: Dict[str, str] = {}
+    for market in markets:
+        try:
+            quote, base = market.split("-")
+        except ValueError:
+            continue
+        symbols[market] = f"{base}/{quote}"
+    return symbols
+
+
 class WSManager:
 
     def __init__(
@@ -24,6 +36,9 @@ class WSManager:
         exchange_name: str = "coinbase",
         debug: bool = False,
         poll_interval_sec: float = 0.4,
+        max_concurrent_requests: int = 8,
+        orderbook_depth: int = 15,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
         self._orderbook_cache = orderbook_cache
         self._vol_cache = vol_cache
@@ -31,10 +46,24 @@ class WSManager:
         self._ticker_markets = list(ticker_markets)
         self._debug = debug
         self._poll_interval = poll_interval_sec
+        self._ob_depth = orderbook_depth
+        # Polls fan out with gather; the semaphore keeps a cycle from
+        # flooding ccxt's rate limiter with every market at once.
+        self._request_slots = asyncio.Semaphore(max_concurrent_requests)
 
         self._tasks: list[asyncio.Task] = []
         self._exchange_name = exchange_name
-        self._exchange = getattr(ccxt, exchange_name)({"enableRateLimit": True})
+        params = {"enableRateLimit": True}
+        if session is not None:
+            params["session"] = session
+        self._exchange = getattr(ccxt, exchange_name)(params)
+        self._bulk_tickers = bool(self._exchange.has.get("fetchTickers"))
+        # Markets that fail to parse stay out of the table and surface as a
+        # per-market KeyError in the poll loops.
+        self._symbol_of = _symbol_table(self._orderbook_markets + self._ticker_markets)
+        self._market_of: Dict[str, str] = {
+            self._symbol_of[m]: m for m in self._ticker_markets if m in self._symbol_of
+        }
 
     async def start(self) -> None:
         await self._exchange.load_markets()
@@ -53,17 +82,34 @@ class WSManager:
     async def stop(self) -> None:
         for t in self._tasks:
             t.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
         await self._exchange.close()
 
+    async def _fetch_orderbook(self, market: str) -> dict:
+        symbol = self._symbol_of[market]
+        async with self._request_slots:
+            return await self._exchange.fetch_order_book(symbol, limit=self._ob_depth)
+
+    async def _fetch_ticker(self, market: str) -> dict:
+        symbol = self._symbol_of[market]
+        async with self._request_slots:
+            return await self._exchange.fetch_ticker(symbol)
+
     async def _poll_orderbooks(self) -> None:
         try:
             while True:
-                for market in self._orderbook_markets:
+                markets = self._orderbook_markets
+                results = await asyncio.gather(
+                    *(self._fetch_orderbook(market) for market in markets),
+                    return_exceptions=True,
+                )
+                for market, ob in zip(markets, results):
+                    if isinstance(ob, BaseException):
+                        if self._debug:
+                            logger.warning("[WS-OB] Failed for %s (%s): %s", self._exchange_name, market, ob)
+                        continue
                     try:
-                        quote, base = market.split("-")
-                        symbol = f"{base}/{quote}"
-
-                        ob = await self._exchange.fetch_order_book(symbol, limit=15)
                         if not ob:
                             continue
 
@@ -86,28 +132,57 @@ class WSManager:
     async def _poll_tickers(self) -> None:
         try:
             while True:
-                for market in self._ticker_markets:
-                    try:
-                        quote, base = market.split("-")
-                        symbol = f"{base}/{quote}"
-
-                        t = await self._exchange.fetch_ticker(symbol)
-                        if "last" not in t:
-                            continue
-
-                        ticker = Ticker(
-                            market=market,
-                            timestamp=int(t.get("timestamp") or 0),
-                            trade_price=float(t["last"]),
-                        )
-                        await self._vol_cache.update_from_ticker(ticker)
-
-                    except Exception as exc:
-                        if self._debug:
-                            logger.warning("[WS-TICK] Failed for %s (%s): %s", self._exchange_name, market, exc)
-                        continue
+                if self._bulk_tickers:
+                    await self._poll_tickers_bulk()
+                else:
+                    await self._poll_tickers_each()
 
                 await asyncio.sleep(self._poll_interval)
 
         except asyncio.CancelledError:
             return
+
+    async def _poll_tickers_bulk(self) -> None:
+        # One request returns every ticker; symbols map straight back to markets.
+        try:
+            async with self._request_slots:
+                tickers = await self._exchange.fetch_tickers(list(self._market_of))
+        except Exception as exc:
+            if self._debug:
+                logger.warning("[WS-TICK] Bulk fetch failed for %s: %s", self._exchange_name, exc)
+            return
+
+        for symbol, t in tickers.items():
+            market = self._market_of.get(symbol)
+            if market is None:
+                continue
+            await self._update_ticker(market, t)
+
+    async def _poll_tickers_each(self) -> None:
+        markets = self._ticker_markets
+        results = await asyncio.gather(
+            *(self._fetch_ticker(market) for market in markets),
+            return_exceptions=True,
+        )
+        for market, t in zip(markets, results):
+            if isinstance(t, BaseException):
+                if self._debug:
+                    logger.warning("[WS-TICK] Failed for %s (%s): %s", self._exchange_name, market, t)
+                continue
+            await self._update_ticker(market, t)
+
+    async def _update_ticker(self, market: str, t: dict) -> None:
+        try:
+            if "last" not in t:
+                return
+
+            ticker = Ticker(
+                market=market,
+                timestamp=int(t.get("timestamp") or 0),
+                trade_price=float(t["last"]),
+            )
+            await self._vol_cache.update_from_ticker(ticker)
+
+        except Exception as exc:
+            if self._debug:
+                logger.warning("[WS-TICK] Failed for %s (%s): %s", self._exchange_name, market, exc)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import List, Sequence
+import asyncio
+from typing import AsyncIterator, Dict, List, Sequence, Tuple
 
+import aiohttp
 import ccxt.async_support as ccxt
 
-from meatna.exchange.models import MarketInfo, OrderbookLevel, Ticker
-from meatna.core.orderbook_cache import OrderbookSnapshot
+from meatna.core.orderbook_cache import OrderbookSnapshot, build_snapshot
+from meatna.exchange.models import MarketInfo, Ticker
 
 
 class RestBootstrapper:
@@ -15,9 +17,12 @@ class RestBootstrapper:
         api_key: str | None = None,
         secret: str | None = None,
         exchange_name: str = "coinbase",
+        session: aiohttp.ClientSession | None = None,
     ):
         self._exchange_name = exchange_name
         params = {"enableRateLimit": True}
+        if session is not None:
+            params["session"] = session
 
         if api_key and secret:
             params["apiKey"] = api_key
@@ -25,6 +30,7 @@ class RestBootstrapper:
 
         self._exchange = getattr(ccxt, exchange_name)(params)
         self._closed = False
+        self._symbol_of: Dict[str, str] = {}
 
     async def __aenter__(self) -> "RestBootstrapper":
         await self._exchange.load_markets()
@@ -33,6 +39,17 @@ class RestBootstrapper:
     async def __aexit__(self, exc_type, exc, tb) -> None:
         await self.close()
 
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    def _symbol(self, market: str) -> str:
+        symbol = self._symbol_of.get(market)
+        if symbol is None:
+            quote, base = market.split("-")
+            symbol = self._symbol_of[market] = f"{base}/{quote}"
+        return symbol
+
     async def close(self) -> None:
         if not self._closed:
             await self._exchange.close()
@@ -60,58 +77,84 @@ class RestBootstrapper:
 
         return result
 
+    async def iter_orderbooks(
+        self,
+        markets: Sequence[str],
+        depth: int = 20,
+        concurrency: int = 8,
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        # Fetches run concurrently under a semaphore and are yielded as they
+        # complete, so the caller can start consuming before the slowest one.
+        slots = asyncio.Semaphore(concurrency)
+
+        async def fetch(market: str) -> Tuple[str, dict | None]:
+            async with slots:
+                try:
+                    return market, await self._exchange.fetch_order_book(self._symbol(market), limit=depth)
+                except Exception:
+                    return market, None
+
+        tasks = [asyncio.ensure_future(fetch(market)) for market in markets]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                market, ob = await next_done
+                if ob:
+                    yield market, ob
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def fetch_orderbooks(
         self,
         markets: Sequence[str],
         depth: int = 20,
     ) -> List[OrderbookSnapshot]:
+        books = {market: ob async for market, ob in self.iter_orderbooks(markets, depth)}
 
         result: List[OrderbookSnapshot] = []
-
         for market in markets:
+            ob = books.get(market)
+            if not ob:
+                continue
             try:
-                quote, base = market.split("-")
-                symbol = f"{base}/{quote}"
-
-                ob = await self._exchange.fetch_order_book(symbol, limit=depth)
-
-                bids = [
-                    OrderbookLevel(price=float(p), size=float(q))
-                    for p, q in ob.get("bids", [])
-                    if p > 0 and q > 0
-                ]
-                asks = [
-                    OrderbookLevel(price=float(p), size=float(q))
-                    for p, q in ob.get("asks", [])
-                    if p > 0 and q > 0
-                ]
-
-                if not bids or not asks:
-                    continue
-
-                snapshot = OrderbookSnapshot(
-                    exchange=self._exchange_name,
-                    market=market,
-                    bids=bids,
-                    asks=asks,
-                    timestamp_ms=int(ob.get("timestamp") or 0),
+                snapshot = build_snapshot(
+                    self._exchange_name,
+                    market,
+                    ob.get("bids") or (),
+                    ob.get("asks") or (),
+                    int(ob.get("timestamp") or 0),
                 )
-
-                result.append(snapshot)
-
             except Exception:
                 continue
+            if snapshot is not None:
+                result.append(snapshot)
 
         return result
 
     async def fetch_ticker(self, market: str) -> Ticker:
-        quote, base = market.split("-")
-        symbol = f"{base}/{quote}"
-
-        t = await self._exchange.fetch_ticker(symbol)
+        t = await self._exchange.fetch_ticker(self._symbol(market))
 
         return Ticker(
             market=market,
             timestamp=int(t.get("timestamp") or 0),
             trade_price=float(t["last"]),
         )
+
+    async def fetch_tickers(self, markets: Sequence[str]) -> List[Ticker]:
+        symbols = {self._symbol(market): market for market in markets}
+
+        if not self._exchange.has.get("fetchTickers"):
+            return [await self.fetch_ticker(market) for market in markets]
+
+        tickers = await self._exchange.fetch_tickers(list(symbols))
+
+        return [
+            Ticker(
+                market=symbols[symbol],
+                timestamp=int(t.get("timestamp") or 0),
+                trade_price=float(t["last"]),
+            )
+            for symbol, t in tickers.items()
+            if symbol in symbols and t.get("last") is not None
+        ]
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+import platform
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None
+
+try:
+    import asyncio_uring
+    IO_URING_AVAILABLE = True
+except ImportError:
+    IO_URING_AVAILABLE = False
+    asyncio_uring = None
+
+_MIN_IO_URING_KERNEL = (5, 15)
+
+
+def _kernel_supports_io_uring() -> bool:
+    if platform.system() != "Linux":
+        return False
+    try:
+        version = tuple(int(part) for part in platform.release().split("-", 1)[0].split(".")[:2])
+    except ValueError:
+        return False
+    return version >= _MIN_IO_URING_KERNEL
+
+
+def install_event_loop_policy(io_uring: bool = False) -> str:
+    # Must run before asyncio.run(); loops that already exist keep their policy.
+    # io_uring is opt-in and falls back to uvloop, then to the stock loop.
+    if io_uring and IO_URING_AVAILABLE and _kernel_supports_io_uring():
+        asyncio.set_event_loop_policy(asyncio_uring.EventLoopPolicy())
+        return "io_uring"
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return "uvloop"
+    return "asyncio"
+
+
+__all__ = ["install_event_loop_policy", "IO_URING_AVAILABLE", "UVLOOP_AVAILABLE"]
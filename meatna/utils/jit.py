@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+__all__ = ["njit", "NUMBA_AVAILABLE"]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import math
-from statistics import pstdev
+from itertools import islice
 from typing import Iterable, Sequence
 
+import numpy as np
+
 
 def log_return(current: float, previous: float) -> float:
     if current <= 0 or previous <= 0:
@@ -12,16 +14,23 @@ def log_return(current: float, previous: float) -> float:
 
 
 def stddev(values: Sequence[float]) -> float:
-    if not values:
-        return 0.0
-    if len(values) == 1:
+    if len(values) < 2:
         return 0.0
-    return pstdev(values)
+    return float(np.std(np.asarray(values, dtype=np.float64)))
 
 
-def sum_top_levels(levels: Iterable, depth: int) -> float:
+def sum_top_levels(levels: np.ndarray | Iterable, depth: int) -> float:
+    # Size arrays (or (N, 2) price/size arrays) are summed in NumPy; level
+    # objects and nested lists go through the per-level loop.
+    if isinstance(levels, np.ndarray):
+        sizes = levels[:depth, 1] if levels.ndim == 2 else levels[:depth]
+        return float(sizes.sum())
+    if not isinstance(levels, (list, tuple)):
+        levels = islice(levels, depth)
+    elif len(levels) > depth:
+        levels = levels[:depth]
     total = 0.0
-    for level in list(levels)[:depth]:
+    for level in levels:
         size = level[1] if isinstance(level, (tuple, list)) else getattr(level, "size", 0.0)
         total += float(size)
     return total
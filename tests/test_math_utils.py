@@ -0,0 +1,16 @@
+import numpy as np
+
+from meatna.utils.math_utils import stddev
+
+
+def test_stddev_list():
+    assert stddev([]) == 0.0
+    assert stddev([1.5]) == 0.0
+    assert stddev([1.0, 3.0]) == 1.0
+
+
+def test_stddev_ndarray():
+    assert stddev(np.array([])) == 0.0
+    assert stddev(np.array([2.0])) == 0.0
+    assert stddev(np.array([1.0, 3.0])) == 1.0
+    assert isinstance(stddev(np.array([1.0, 3.0])), float)